@@ -12,6 +12,7 @@ import logging
 from app.core.database import get_db
 from app.models.assistant import Assistant, SourceType, AssistantTemplate, AssistantStatus
 from app.models.project import Project
+from app.services.status_updater import build_system_prompt
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -164,7 +165,11 @@ async def create_assistant(
             template=request.template,
             status=AssistantStatus.CREATING,
             governance_rules=governance_rules,
-            allowed_intents=allowed_intents
+            allowed_intents=allowed_intents,
+            # Set eagerly so the status monitor never has to generate it
+            system_prompt=build_system_prompt(
+                request.template.value, request.name, tuple(allowed_intents)
+            )
         )
         
         db.add(assistant)
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel, HttpUrl
 from typing import List, Optional, Dict, Any
+import hashlib
 import uuid
 import asyncio
 import json
@@ -22,8 +23,9 @@ from app.models.project import Project, ProjectStatus
 from app.services.project_deletion import ProjectDeletionService
 from app.models.assistant import Assistant, AssistantStatus, AssistantTemplate, SourceType
 from app.models.content import IngestionJob, JobStatus
-from app.models.ingestion_tracking import IngestionURL, URLStatus
+from app.models.ingestion_tracking import IngestionURL, IngestionURLRaw, URLStatus
 from app.services.web_scraper import WebScraperService, ScrapingConfig
+from app.services.status_updater import build_system_prompt
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -106,10 +108,11 @@ async def scrape_website_master(
         scrape_complete = threading.Event()
         scrape_result: Dict[str, Any] = {"data": None, "error": None}
 
-        def progress_callback(progress_info: Dict[str, Any]):
+        def progress_callback(progress_events: List[Dict[str, Any]]):
+            # The scraper delivers events in batches
             try:
                 with progress_lock:
-                    progress_list.append(progress_info)
+                    progress_list.extend(progress_events)
             except Exception:
                 return
 
@@ -147,6 +150,10 @@ async def scrape_website_master(
                     template=request.template,
                     status=AssistantStatus.CREATING,
                     status_message=f"Discovering content from {request.site_url}",
+                    # Set eagerly so the status monitor never has to generate it
+                    system_prompt=build_system_prompt(
+                        request.template.value, request.name, ()
+                    ),
                 )
                 db.add(assistant)
                 await db.flush()
@@ -163,11 +170,11 @@ async def scrape_website_master(
                 await db.commit()
 
                 # Let the client know identifiers early, so it can recover by fetching from DB
-                progress_callback({
+                progress_callback([{
                     "event_type": "init",
                     "assistant_id": str(assistant.id),
                     "job_id": str(job.id),
-                })
+                }])
 
                 scraper = WebScraperService()
                 config = ScrapingConfig(
@@ -196,20 +203,30 @@ async def scrape_website_master(
                 # Don't set completed_at yet - job isn't fully complete until ingestion finishes
 
                 for page in pages:
-                    url_hash = uuid.uuid5(uuid.NAMESPACE_URL, page.url).hex
+                    # Raw digest - the url_hash column is BYTEA
+                    url_hash = hashlib.sha256(page.url.encode('utf-8')).digest()
+                    url_id = uuid.uuid4()
                     db.add(
                         IngestionURL(
+                            id=url_id,
                             job_id=job.id,
                             url=page.url,
                             url_hash=url_hash,
                             status=URLStatus.SCRAPED.value,
                             title=page.title,
                             content_type=page.content_type,
-                            raw_content=page.content,
                             content_length=len(page.content),
                             scraped_at=page.scraped_at,
                         )
                     )
+                    # Page body goes to the unlogged staging table
+                    db.add(
+                        IngestionURLRaw(
+                            url_id=url_id,
+                            job_id=job.id,
+                            raw_content=page.content,
+                        )
+                    )
 
                 assistant.total_pages_crawled = str(len(pages))
                 await db.commit()
@@ -353,7 +370,11 @@ async def get_scraped_url_content(
     if not row:
         raise HTTPException(status_code=404, detail="URL not found for this job")
 
-    if not row.raw_content:
+    raw_result = await db.execute(
+        select(IngestionURLRaw.raw_content).where(IngestionURLRaw.url_id == row.id)
+    )
+    raw_content = raw_result.scalar_one_or_none()
+    if not raw_content:
         raise HTTPException(status_code=404, detail="No scraped content stored for this URL")
 
     return ScrapedUrlContentResponse(
@@ -361,7 +382,7 @@ async def get_scraped_url_content(
         url=row.url,
         title=row.title,
         content_type=row.content_type,
-        raw_content=row.raw_content,
+        raw_content=raw_content,
         content_length=row.content_length,
         scraped_at=row.scraped_at.isoformat() if row.scraped_at else None,
     )
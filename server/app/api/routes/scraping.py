@@ -77,11 +77,11 @@ async def preview_website_content_stream(
         preview_complete = threading.Event()
         preview_result = {'data': None, 'error': None}
         
-        def progress_callback(progress_info: Dict[str, Any]):
-            """Callback to add progress events"""
+        def progress_callback(progress_events: List[Dict[str, Any]]):
+            """Callback to add a batch of progress events"""
             try:
                 with progress_lock:
-                    progress_list.append(progress_info)
+                    progress_list.extend(progress_events)
             except Exception as e:
                 logger.error(f"Error adding progress: {e}")
         
@@ -176,7 +176,10 @@ async def test_single_page_scraping(
         processor = ContentProcessor()
         
         # Scrape single page
-        scraped_page = await scraper.scrape_single_page(str(url))
+        try:
+            scraped_page = await scraper.scrape_single_page(str(url))
+        finally:
+            scraper.close()  # Release the pooled driver
         
         if not scraped_page:
             raise HTTPException(status_code=400, detail="Failed to scrape the page")
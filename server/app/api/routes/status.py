@@ -2,6 +2,7 @@
 Status Monitoring API
 Real-time status updates and system monitoring
 """
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
@@ -12,6 +13,9 @@ from app.services.status_updater import StatusUpdateService
 
 router = APIRouter(prefix="/status", tags=["status"])
 
+# Timestamp fields are typed as datetime and serialized by orjson at the
+# response layer - no manual isoformat() conversions in the services
+
 class AssistantStatusResponse(BaseModel):
     """Assistant status response"""
     assistant_id: str
@@ -21,7 +25,7 @@ class AssistantStatusResponse(BaseModel):
     total_chunks: str
     total_pages: str
     recent_jobs: List[Dict[str, Any]]
-    last_updated: Optional[str]
+    last_updated: Optional[datetime]
 
 class JobStatusResponse(BaseModel):
     """Job status response"""
@@ -32,8 +36,8 @@ class JobStatusResponse(BaseModel):
     pages_processed: int
     chunks_created: int
     errors_count: int
-    started_at: Optional[str]
-    completed_at: Optional[str]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
 
 class SystemHealthResponse(BaseModel):
     """System health response"""
@@ -41,7 +45,7 @@ class SystemHealthResponse(BaseModel):
     services: Dict[str, str]
     active_jobs: int
     stale_jobs_cleaned: int
-    timestamp: str
+    timestamp: datetime
 
 # Dependency to get status service
 def get_status_service() -> StatusUpdateService:
@@ -115,7 +119,6 @@ async def system_health_check(
 ):
     """Comprehensive system health check"""
     try:
-        from datetime import datetime
         from sqlalchemy import select, func
         from app.models.content import IngestionJob
         
@@ -159,7 +162,7 @@ async def system_health_check(
             services=services,
             active_jobs=active_jobs,
             stale_jobs_cleaned=stale_cleaned,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=datetime.utcnow()
         )
         
     except Exception as e:
@@ -168,7 +171,7 @@ async def system_health_check(
             services={"error": str(e)},
             active_jobs=0,
             stale_jobs_cleaned=0,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=datetime.utcnow()
         )
 
 @router.get("/jobs/active")
@@ -177,7 +180,7 @@ async def get_active_jobs(
 ):
     """Get all currently active jobs"""
     try:
-        from sqlalchemy import select
+        from sqlalchemy import select, func
         from app.models.content import IngestionJob
         
         # Get active jobs from database
@@ -197,7 +200,7 @@ async def get_active_jobs(
                 "urls_discovered": job.total_urls_discovered or 0,
                 "urls_scraped": job.urls_scraped or 0,
                 "chunks_created": job.total_chunks_created or 0,
-                "started_at": job.started_at.isoformat() if job.started_at else None
+                "started_at": job.started_at
             }
             for job in jobs
         ]
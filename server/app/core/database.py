@@ -1,22 +1,36 @@
 """
 Database configuration and initialization
 """
+import asyncio
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
-# Create async engine with memory optimization
+# Create async engine sized for the progress-polling workload - the status
+# and progress endpoints issue high-frequency short queries, so keep enough
+# pooled connections to absorb bursty poll fanout
 async_engine = create_async_engine(
     settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.DEBUG,
     future=True,
-    pool_size=5,  # Reduce connection pool size
-    max_overflow=5,  # Limit overflow connections
+    # Explicit async-aware pool: a plain QueuePool blocks the event loop
+    # when it waits for a connection
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,  # Steady-state connections for pollers + stale-job fan-out
+    max_overflow=20,  # Burst headroom beyond the steady pool
     pool_pre_ping=True,  # Verify connections before use
-    pool_recycle=3600  # Recycle connections after 1 hour
+    pool_recycle=1800,  # Recycle connections after 30 minutes
+    connect_args={
+        "statement_cache_size": 1024,  # Reuse asyncpg prepared statements
+        # SQLAlchemy's own per-connection cache of asyncpg prepared
+        # statements - repeat queries skip the parse+plan round entirely
+        "prepared_statement_cache_size": 256,
+    },
 )
 
 # Create async session factory
@@ -38,6 +52,20 @@ async def init_db():
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
+async def warm_up_pool(connections: int = 10):
+    """Pre-create pooled connections so early requests skip the connect cost.
+
+    The pool has no min_size - connections are created lazily on first
+    checkout, so the first burst of requests after startup would each pay
+    TCP + TLS + auth latency. Opening a batch in parallel and releasing
+    them leaves the pool primed.
+    """
+    async def _open():
+        async with async_engine.connect() as conn:
+            await asyncio.sleep(0.05)  # Hold briefly so checkouts don't share one connection
+
+    await asyncio.gather(*(_open() for _ in range(connections)))
+
 async def get_db():
     """Dependency to get database session"""
     async with AsyncSessionLocal() as session:
@@ -1,16 +1,51 @@
 """
 Qdrant vector database client for semantic search
 """
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct, PayloadSchemaType
 from typing import List, Dict, Any, Optional
+import re
 import uuid
 
 from app.core.config import settings
 
+# Collection names collapse to lowercase [a-z0-9_]. \W mirrors the old
+# per-character isalnum() generator exactly (underscores already pass
+# through) but runs as one C-level substitution instead of a Python loop
+# per character
+_SANITIZE_RE = re.compile(r'\W')
+
+def collection_name_for(assistant_name: str, user_name: str) -> str:
+    """Build the sanitized per-assistant collection name"""
+    return (
+        f"{_SANITIZE_RE.sub('_', assistant_name.lower())}_"
+        f"{_SANITIZE_RE.sub('_', user_name.lower())}"
+    )
+
 # Global Qdrant client
 qdrant_client: Optional[QdrantClient] = None
 
+# Process-wide async client shared by migration/maintenance scripts so each
+# script invocation pays the DNS + TCP + TLS setup once
+_async_qdrant_client: Optional[AsyncQdrantClient] = None
+
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    """Get the shared async Qdrant client, creating it on first use.
+
+    gRPC transport is preferred - it skips per-request HTTP parsing, which
+    matters for scripts that fan out many small calls (index creation,
+    collection migration).
+    """
+    global _async_qdrant_client
+    if _async_qdrant_client is None:
+        _async_qdrant_client = AsyncQdrantClient(
+            url=settings.QDRANT_URL,
+            api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None,
+            prefer_grpc=True,
+            timeout=30,
+        )
+    return _async_qdrant_client
+
 async def init_qdrant():
     """Initialize Qdrant client and collections"""
     global qdrant_client
@@ -52,9 +87,7 @@ async def ensure_collections():
 async def ensure_assistant_collection(assistant_name: str, user_name: str):
     """Ensure assistant-specific collection exists with proper indexing"""
     # Create safe collection name from assistant name + user name
-    safe_assistant_name = "".join(c.lower() if c.isalnum() else "_" for c in assistant_name)
-    safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-    collection_name = f"{safe_assistant_name}_{safe_user_name}"
+    collection_name = collection_name_for(assistant_name, user_name)
     
     try:
         # Check if collection exists
@@ -126,9 +159,7 @@ async def store_embeddings(
     
     # Use assistant-specific collection if names provided
     if assistant_name and user_name:
-        safe_assistant_name = "".join(c.lower() if c.isalnum() else "_" for c in assistant_name)
-        safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-        collection_name = f"{safe_assistant_name}_{safe_user_name}"
+        collection_name = collection_name_for(assistant_name, user_name)
         await ensure_assistant_collection(assistant_name, user_name)
     else:
         collection_name = "flakers_content"
@@ -199,9 +230,7 @@ async def search_similar_content(
     
     # Use assistant-specific collection if names provided
     if assistant_name and user_name:
-        safe_assistant_name = "".join(c.lower() if c.isalnum() else "_" for c in assistant_name)
-        safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-        collection_name = f"{safe_assistant_name}_{safe_user_name}"
+        collection_name = collection_name_for(assistant_name, user_name)
     else:
         collection_name = "flakers_content"
     
@@ -255,9 +284,7 @@ async def delete_assistant_content(assistant_id: str, assistant_name: Optional[s
     
     # Use assistant-specific collection if names provided
     if assistant_name and user_name:
-        safe_assistant_name = "".join(c.lower() if c.isalnum() else "_" for c in assistant_name)
-        safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-        collection_name = f"{safe_assistant_name}_{safe_user_name}"
+        collection_name = collection_name_for(assistant_name, user_name)
     else:
         collection_name = "flakers_content"
     
@@ -274,14 +301,17 @@ async def delete_assistant_content(assistant_id: str, assistant_name: Optional[s
     )
 
 async def delete_assistant_collection(assistant_name: str, user_name: str):
-    """Delete entire assistant collection"""
-    client = get_qdrant_client()
-    safe_assistant_name = "".join(c.lower() if c.isalnum() else "_" for c in assistant_name)
-    safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-    collection_name = f"{safe_assistant_name}_{safe_user_name}"
-    
+    """Delete entire assistant collection
+
+    Uses the async client: the sync client's delete_collection is a
+    blocking HTTP call that would stall the event loop and serialize
+    callers that gather several deletions.
+    """
+    client = get_async_qdrant_client()
+    collection_name = collection_name_for(assistant_name, user_name)
+
     try:
-        client.delete_collection(collection_name)
+        await client.delete_collection(collection_name)
         print(f"Deleted assistant collection: {collection_name}")
     except Exception as e:
         print(f"Error deleting assistant collection: {e}")
@@ -5,12 +5,12 @@ from .project import Project, ProjectStatus
 from .assistant import Assistant, SourceType, AssistantTemplate, AssistantStatus
 from .content import ContentChunk, ContentIntent, IngestionJob
 from .chat import ChatSession, ChatMessage
-from .ingestion_tracking import IngestionURL, IngestionChunk, JobStatus, URLStatus, ChunkStatus
+from .ingestion_tracking import IngestionURL, IngestionURLRaw, IngestionChunk, JobStatus, URLStatus, ChunkStatus
 
 __all__ = [
     "Project", "ProjectStatus",
     "Assistant", "SourceType", "AssistantTemplate", "AssistantStatus",
-    "ContentChunk", "ContentIntent", "IngestionJob", 
+    "ContentChunk", "ContentIntent", "IngestionJob",
     "ChatSession", "ChatMessage",
-    "IngestionURL", "IngestionChunk", "JobStatus", "URLStatus", "ChunkStatus"
+    "IngestionURL", "IngestionURLRaw", "IngestionChunk", "JobStatus", "URLStatus", "ChunkStatus"
 ]
\ No newline at end of file
@@ -126,6 +126,7 @@ class IngestionJob(Base):
     
     # Relationships
     project = relationship("Project", back_populates="ingestion_jobs")
+    assistant = relationship("Assistant")
     urls = relationship("IngestionURL", back_populates="job", cascade="all, delete-orphan")
     
     def __repr__(self):
@@ -2,8 +2,12 @@
 Ingestion tracking models - URL and chunk-level state management
 Supports resumable, multi-stage ingestion pipeline
 """
-from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, ForeignKey, Text, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import (
+    Column, String, DateTime, Integer, Float, Boolean, ForeignKey,
+    ForeignKeyConstraint, LargeBinary, Text, Index, UniqueConstraint,
+    event, text,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -41,28 +45,57 @@ class ChunkStatus(str, enum.Enum):
     FAILED = "failed"
     RETRYING = "retrying"
 
+# Native Postgres enum types for the status columns - 4 bytes per row
+# instead of varchar text, and the planner gets per-value statistics. The
+# values (not the member names) are what the pipeline stores and compares.
+URL_STATUS_TYPE = ENUM(*(s.value for s in URLStatus), name="url_status")
+CHUNK_STATUS_TYPE = ENUM(*(s.value for s in ChunkStatus), name="chunk_status")
+
+# Hash-partition member count; must match the migration's NUM_PARTITIONS
+NUM_PARTITIONS = 32
+
+def _create_partitions(target, connection, **kw):
+    """Create the hash-partition members right after the parent.
+
+    create_all only emits the PARTITION BY parent; without members the
+    first INSERT fails with "no partition of relation found for row".
+    Fresh deployments go straight through create_all (init_db /
+    setup_database) with no migration step, so the members are created
+    here. FILLFACTOR 70 leaves page space for the status/retry updates
+    these rows get, keeping most UPDATEs HOT.
+    """
+    for i in range(NUM_PARTITIONS):
+        connection.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {target.name}_p{i} PARTITION OF {target.name} "
+            f"FOR VALUES WITH (MODULUS {NUM_PARTITIONS}, REMAINDER {i}) "
+            f"WITH (FILLFACTOR = 70)"
+        )
+
 class IngestionURL(Base):
     """
     Tracks individual URL processing through the pipeline
     """
     __tablename__ = "ingestion_urls"
-    
+
+    # Hash-partitioned on job_id; the partition key must be part of the
+    # primary key, hence the composite (job_id, id)
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
-    
+    # No single-column index: the idx_url_job_status composite's job_id prefix covers it
+    job_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), primary_key=True, nullable=False)
+
     # URL Information
     url = Column(String(2000), nullable=False)
-    url_hash = Column(String(64), nullable=False, index=True)  # For deduplication
+    url_hash = Column(LargeBinary, nullable=False, index=True)  # Raw 32-byte SHA-256, for deduplication
     
-    # Status
-    status = Column(String(50), nullable=False, default=URLStatus.DISCOVERED.value, index=True)
+    # Status - indexed partially (pending rows only), see __table_args__
+    status = Column(URL_STATUS_TYPE, nullable=False, default=URLStatus.DISCOVERED.value)
     
     # Scraping Results
     title = Column(String(500))
     content_type = Column(String(50))
     language = Column(String(10))  # ISO language code (en, es, fr, etc.)
     word_count = Column(Integer)
-    raw_content = Column(Text)  # Store raw scraped content
+    # raw_content lives in IngestionURLRaw (unlogged) - see below
     content_length = Column(Integer)
     
     # Processing Results
@@ -78,46 +111,84 @@ class IngestionURL(Base):
     retry_count = Column(Integer, default=0)
     is_retryable = Column(Boolean, default=True)  # Whether failure can be retried
     
-    # Timestamps
+    # Timestamps. No updated_at: Postgres already versions every row via
+    # the xmin system column (SELECT xmin FROM ingestion_urls WHERE ...),
+    # which covers the has-this-row-changed check for free
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+
     # Relationships
     job = relationship("IngestionJob", back_populates="urls")
     chunks = relationship("IngestionChunk", back_populates="url", cascade="all, delete-orphan")
     
     __table_args__ = (
-        Index('idx_url_job_status', 'job_id', 'status'),
+        # Partial: terminal rows dominate the table over time and are never
+        # looked up by status, so only pending work is indexed
+        Index('idx_url_job_status', 'job_id', 'status',
+              postgresql_include=['id', 'url', 'retry_count'],
+              postgresql_where=text("status NOT IN ('completed', 'failed')")),
         Index('idx_job_url_hash', 'job_id', 'url_hash'),
+        {'postgresql_partition_by': 'HASH (job_id)'},
     )
-    
+
     def __repr__(self):
         return f"<IngestionURL {self.url} - {self.status}>"
 
+event.listen(IngestionURL.__table__, "after_create", _create_partitions)
+
+class IngestionURLRaw(Base):
+    """
+    Staging table for scraped page content, kept out of ingestion_urls
+
+    raw_content is often many KB per row and only exists to be chunked, so
+    it goes in an UNLOGGED table: inserts skip WAL entirely. A crash loses
+    the raw HTML, which can simply be re-scraped.
+    """
+    __tablename__ = "ingestion_urls_raw"
+
+    url_id = Column(UUID(as_uuid=True), primary_key=True)
+    job_id = Column(UUID(as_uuid=True), nullable=False)
+    raw_content = Column(Text)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['job_id', 'url_id'],
+            ['ingestion_urls.job_id', 'ingestion_urls.id'],
+            ondelete="CASCADE",
+        ),
+        {'prefixes': ['UNLOGGED']},
+    )
+
+    def __repr__(self):
+        return f"<IngestionURLRaw {self.url_id}>"
+
 class IngestionChunk(Base):
     """
     Tracks individual chunk upload status
     Supports partial ingestion and retry logic
     """
     __tablename__ = "ingestion_chunks"
-    
+
+    # Hash-partitioned on job_id like ingestion_urls - composite primary
+    # key, and the url FK references the parent's composite key
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    url_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_urls.id", ondelete="CASCADE"), nullable=False, index=True)
-    job_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
-    
+    # No single-column indexes here: the composite indexes below cover
+    # job_id and url_id via their leading columns
+    url_id = Column(UUID(as_uuid=True), nullable=False)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("ingestion_jobs.id", ondelete="CASCADE"), primary_key=True, nullable=False)
+
     # Chunk Identification
-    chunk_id = Column(String(100), nullable=False, unique=True, index=True)  # Deterministic ID
+    chunk_id = Column(UUID(as_uuid=True), nullable=False, index=True)  # Deterministic ID; unique per job
     chunk_index = Column(Integer, nullable=False)
     
     # Content
     content = Column(Text, nullable=False)
-    content_hash = Column(String(64), nullable=False, index=True)
+    content_hash = Column(LargeBinary, nullable=False, index=True)  # Raw 32-byte SHA-256
     
-    # Status
-    status = Column(String(50), nullable=False, default=ChunkStatus.QUEUED.value, index=True)
+    # Status - indexed partially (pending rows only), see __table_args__
+    status = Column(CHUNK_STATUS_TYPE, nullable=False, default=ChunkStatus.QUEUED.value)
     
     # Vector DB Reference
-    qdrant_point_id = Column(String(100), unique=True)  # Set after successful upload
+    qdrant_point_id = Column(UUID(as_uuid=True))  # Set after successful upload; unique per job
     
     # Metadata
     intent = Column(String(50))
@@ -130,9 +201,9 @@ class IngestionChunk(Base):
     is_retryable = Column(Boolean, default=True)  # Whether failure can be retried
     last_retry_at = Column(DateTime(timezone=True))
     
-    # Timestamps
+    # Timestamps. No updated_at - xmin serves as the row version, as on
+    # IngestionURL
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     uploaded_at = Column(DateTime(timezone=True))
     
     # Relationships
@@ -140,10 +211,24 @@ class IngestionChunk(Base):
     job = relationship("IngestionJob")
     
     __table_args__ = (
-        Index('idx_chunk_job_status', 'job_id', 'status'),
+        ForeignKeyConstraint(
+            ['job_id', 'url_id'],
+            ['ingestion_urls.job_id', 'ingestion_urls.id'],
+            ondelete="CASCADE",
+        ),
+        UniqueConstraint('job_id', 'chunk_id'),
+        UniqueConstraint('job_id', 'qdrant_point_id'),
+        # Partial: uploaded chunks are dead weight here, but failed ones
+        # stay indexed for the retry scan
+        Index('idx_chunk_job_status', 'job_id', 'status',
+              postgresql_include=['id', 'chunk_index', 'retry_count', 'url_id'],
+              postgresql_where=text("status <> 'uploaded'")),
         Index('idx_url_status', 'url_id', 'status'),
         Index('idx_chunk_id', 'chunk_id'),
+        {'postgresql_partition_by': 'HASH (job_id)'},
     )
-    
+
     def __repr__(self):
         return f"<IngestionChunk {self.chunk_id} - {self.status}>"
+
+event.listen(IngestionChunk.__table__, "after_create", _create_partitions)
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from app.models.content import IngestionJob, ContentChunk, JobStatus
-from app.models.ingestion_tracking import IngestionURL, IngestionChunk, URLStatus, ChunkStatus
+from app.models.ingestion_tracking import IngestionURL, IngestionURLRaw, IngestionChunk, URLStatus, ChunkStatus
 from app.models.assistant import Assistant, AssistantStatus
 from app.services.content_processor import ContentProcessor
 from app.services.embeddings import EmbeddingService
@@ -92,30 +92,33 @@ class IngestionService:
                 job.current_stage = "processing"
                 await db.commit()
                 
-                # Get scraped URLs from database
+                # Get scraped URLs from database, joined against the
+                # unlogged staging table holding the page bodies
                 result = await db.execute(
-                    select(IngestionURL)
+                    select(IngestionURL, IngestionURLRaw.raw_content)
+                    .outerjoin(IngestionURLRaw, IngestionURLRaw.url_id == IngestionURL.id)
                     .where(
                         IngestionURL.job_id == job_id,
                         IngestionURL.status.in_([URLStatus.SCRAPED.value, URLStatus.PROCESSED.value])
                     )
                 )
-                scraped_urls = result.scalars().all()
-                
+                scraped_rows = result.all()
+                scraped_urls = [row[0] for row in scraped_rows]
+
                 if not scraped_urls:
                     raise Exception("No scraped content found in database")
-                
+
                 logger.info(f"Job {job_id}: Processing {len(scraped_urls)} scraped pages")
-                
+
                 # Process each URL into chunks
                 all_chunks = []
-                for url_record in scraped_urls:
+                for url_record, raw_content in scraped_rows:
                     # Create ScrapedPage object for processor
                     from app.services.web_scraper import ScrapedPage
                     scraped_page = ScrapedPage(
                         url=url_record.url,
                         title=url_record.title or "",
-                        content=url_record.raw_content,
+                        content=raw_content or "",
                         meta_description="",
                         links=[],
                         images=[],
@@ -134,7 +137,10 @@ class IngestionService:
                     url_record.processed_at = datetime.utcnow()
                 
                 job.total_chunks_created = len(all_chunks)
+                # Keep the per-status rollup counters exclusive - these URLs
+                # just moved from scraped to processed
                 job.urls_processed = len(scraped_urls)
+                job.urls_scraped = 0
                 await db.commit()
                 
                 logger.info(f"Job {job_id}: Generated {len(all_chunks)} chunks")
@@ -214,6 +220,7 @@ class IngestionService:
                 job.status = JobStatus.COMPLETED.value
                 job.current_stage = "completed"
                 job.urls_completed = len(scraped_urls)
+                job.urls_processed = 0
                 job.completed_at = datetime.utcnow()
                 await db.commit()
                 
@@ -4,6 +4,7 @@ Provides truthful, state-based progress reporting
 Never fabricates completion percentages or totals
 """
 import logging
+from collections import namedtuple
 from typing import Dict, Any, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -13,6 +14,21 @@ from app.models.ingestion_tracking import IngestionURL, IngestionChunk, URLStatu
 
 logger = logging.getLogger(__name__)
 
+# Status values hoisted to module constants - avoids repeated enum attribute
+# lookups on every progress poll
+_CHUNK_QUEUED = ChunkStatus.QUEUED.value
+_CHUNK_UPLOADING = ChunkStatus.UPLOADING.value
+_CHUNK_UPLOADED = ChunkStatus.UPLOADED.value
+_CHUNK_FAILED = ChunkStatus.FAILED.value
+_CHUNK_RETRYING = ChunkStatus.RETRYING.value
+
+# Stages before content processing - no chunks can exist yet
+_PRE_CHUNK_STAGES = ("discovery", "scraping", "storing", "discovery_complete")
+
+_EMPTY_CHUNK_COUNTS = namedtuple(
+    "ChunkCounts", ["queued", "uploading", "uploaded", "failed", "retrying"]
+)(0, 0, 0, 0, 0)
+
 class ProgressReporter:
     """
     Truthful progress reporter
@@ -41,27 +57,40 @@ class ProgressReporter:
         if not job:
             return {"error": "Job not found"}
         
-        # Get URL counts by status
-        url_counts_result = await db.execute(
-            select(
-                IngestionURL.status,
-                func.count(IngestionURL.id)
-            )
-            .where(IngestionURL.job_id == job_id)
-            .group_by(IngestionURL.status)
+        # URL counts come from the denormalized per-status counters on the job
+        # row, maintained transactionally by the workers that transition URL
+        # state - no GROUP BY scan over ingestion_urls on every poll
+        urls_scraped = job.urls_scraped or 0
+        urls_failed_scraping = job.urls_failed_scraping or 0
+        urls_processed = job.urls_processed or 0
+        urls_failed_processing = job.urls_failed_processing or 0
+        urls_completed = job.urls_completed or 0
+        urls_partial = job.urls_partial or 0
+        urls_failed = job.urls_failed or 0
+        urls_accounted = (
+            urls_scraped + urls_failed_scraping + urls_processed +
+            urls_failed_processing + urls_completed + urls_partial + urls_failed
         )
-        url_counts = {row[0]: row[1] for row in url_counts_result.all()}
-        
-        # Get chunk counts by status (if chunks exist)
-        chunk_counts_result = await db.execute(
-            select(
-                IngestionChunk.status,
-                func.count(IngestionChunk.id)
+
+        # Skip the chunk-count query entirely while the job is still in the
+        # discovery/scraping phase - no chunks exist yet, so the round-trip
+        # would only ever return zeros
+        if job.current_stage in _PRE_CHUNK_STAGES or not job.total_urls_discovered:
+            chunk_counts = _EMPTY_CHUNK_COUNTS
+        else:
+            # Get chunk counts by status - conditional aggregates return all
+            # counters in one row, so no GROUP BY and no dict merge
+            chunk_counts_result = await db.execute(
+                select(
+                    func.count().filter(IngestionChunk.status == _CHUNK_QUEUED).label("queued"),
+                    func.count().filter(IngestionChunk.status == _CHUNK_UPLOADING).label("uploading"),
+                    func.count().filter(IngestionChunk.status == _CHUNK_UPLOADED).label("uploaded"),
+                    func.count().filter(IngestionChunk.status == _CHUNK_FAILED).label("failed"),
+                    func.count().filter(IngestionChunk.status == _CHUNK_RETRYING).label("retrying")
+                )
+                .where(IngestionChunk.job_id == job_id)
             )
-            .where(IngestionChunk.job_id == job_id)
-            .group_by(IngestionChunk.status)
-        )
-        chunk_counts = {row[0]: row[1] for row in chunk_counts_result.all()}
+            chunk_counts = chunk_counts_result.one()
         
         # Build progress report
         progress = {
@@ -76,18 +105,20 @@ class ProgressReporter:
             },
             
             # URL-level progress
+            # URLs transition between stages in whole batches, so anything not
+            # yet counted in a stage bucket is still in the discovered state
             "urls": {
                 "total": job.total_urls_discovered,
-                "discovered": url_counts.get(URLStatus.DISCOVERED.value, 0),
-                "scraping": url_counts.get(URLStatus.SCRAPING.value, 0),
-                "scraped": url_counts.get(URLStatus.SCRAPED.value, 0),
-                "failed_scraping": url_counts.get(URLStatus.FAILED_SCRAPING.value, 0),
-                "processing": url_counts.get(URLStatus.PROCESSING.value, 0),
-                "processed": url_counts.get(URLStatus.PROCESSED.value, 0),
-                "failed_processing": url_counts.get(URLStatus.FAILED_PROCESSING.value, 0),
-                "completed": url_counts.get(URLStatus.COMPLETED.value, 0),
-                "partial": url_counts.get(URLStatus.PARTIAL.value, 0),
-                "failed": url_counts.get(URLStatus.FAILED.value, 0)
+                "discovered": max((job.total_urls_discovered or 0) - urls_accounted, 0),
+                "scraping": 0,
+                "scraped": urls_scraped,
+                "failed_scraping": urls_failed_scraping,
+                "processing": 0,
+                "processed": urls_processed,
+                "failed_processing": urls_failed_processing,
+                "completed": urls_completed,
+                "partial": urls_partial,
+                "failed": urls_failed
             },
             
             # Chunk-level progress
@@ -110,34 +141,42 @@ class ProgressReporter:
         return progress
     
     @staticmethod
-    def _get_chunk_progress(job: IngestionJob, chunk_counts: Dict[str, int]) -> Dict[str, Any]:
+    def _get_chunk_progress(job: IngestionJob, chunk_counts) -> Dict[str, Any]:
         """
-        Get chunk-level progress
+        Get chunk-level progress from the conditional-aggregate counts row
         Only shows percentages when total is known
         """
         total_chunks = job.total_chunks_created
-        
+
         if total_chunks is None:
             # Total not yet known - processing still in progress
             return {
                 "status": "in_progress",
                 "message": "Processing URLs - final chunk count pending",
-                "queued": chunk_counts.get(ChunkStatus.QUEUED.value, 0),
-                "uploading": chunk_counts.get(ChunkStatus.UPLOADING.value, 0),
-                "uploaded": chunk_counts.get(ChunkStatus.UPLOADED.value, 0),
-                "failed": chunk_counts.get(ChunkStatus.FAILED.value, 0),
-                "retrying": chunk_counts.get(ChunkStatus.RETRYING.value, 0)
+                "queued": chunk_counts.queued,
+                "uploading": chunk_counts.uploading,
+                "uploaded": chunk_counts.uploaded,
+                "failed": chunk_counts.failed,
+                "retrying": chunk_counts.retrying
             }
-        
+
         # Total is known - can show percentages
-        uploaded = chunk_counts.get(ChunkStatus.UPLOADED.value, 0)
-        failed = chunk_counts.get(ChunkStatus.FAILED.value, 0)
-        queued = chunk_counts.get(ChunkStatus.QUEUED.value, 0)
-        uploading = chunk_counts.get(ChunkStatus.UPLOADING.value, 0)
-        retrying = chunk_counts.get(ChunkStatus.RETRYING.value, 0)
+        uploaded = chunk_counts.uploaded
+        failed = chunk_counts.failed
+        queued = chunk_counts.queued
+        uploading = chunk_counts.uploading
+        retrying = chunk_counts.retrying
         
         completed_count = uploaded + failed  # Both are "done" (success or failure)
-        
+
+        # Integer arithmetic avoids float division + round() on this hot polling path
+        if total_chunks > 0:
+            percentage_complete = (completed_count * 10000) // total_chunks / 100.0
+            percentage_uploaded = (uploaded * 10000) // total_chunks / 100.0
+        else:
+            percentage_complete = 0
+            percentage_uploaded = 0
+
         return {
             "status": "known",
             "total": total_chunks,
@@ -147,33 +186,45 @@ class ProgressReporter:
             "failed": failed,
             "retrying": retrying,
             "completed_count": completed_count,
-            "percentage_complete": round((completed_count / total_chunks * 100), 2) if total_chunks > 0 else 0,
-            "percentage_uploaded": round((uploaded / total_chunks * 100), 2) if total_chunks > 0 else 0
+            "percentage_complete": percentage_complete,
+            "percentage_uploaded": percentage_uploaded
         }
     
     @staticmethod
     async def get_url_details(db: AsyncSession, job_id: str) -> List[Dict[str, Any]]:
         """Get detailed status for all URLs in a job"""
+        # Project only the reported columns - skips ORM hydration for
+        # every URL
         result = await db.execute(
-            select(IngestionURL)
+            select(
+                IngestionURL.id,
+                IngestionURL.url,
+                IngestionURL.status,
+                IngestionURL.title,
+                IngestionURL.content_type,
+                IngestionURL.content_length,
+                IngestionURL.chunk_count,
+                IngestionURL.failure_reason,
+                IngestionURL.scraped_at,
+                IngestionURL.processed_at
+            )
             .where(IngestionURL.job_id == job_id)
             .order_by(IngestionURL.created_at)
         )
-        urls = result.scalars().all()
-        
+        urls = result.all()
+
         url_details = []
         for url in urls:
             # Get chunk counts for this URL
             chunk_result = await db.execute(
                 select(
-                    IngestionChunk.status,
-                    func.count(IngestionChunk.id)
+                    func.count().filter(IngestionChunk.status == _CHUNK_UPLOADED).label("uploaded"),
+                    func.count().filter(IngestionChunk.status == _CHUNK_FAILED).label("failed")
                 )
                 .where(IngestionChunk.url_id == url.id)
-                .group_by(IngestionChunk.status)
             )
-            chunk_counts = {row[0]: row[1] for row in chunk_result.all()}
-            
+            chunk_counts = chunk_result.one()
+
             url_details.append({
                 "url": url.url,
                 "status": url.status,
@@ -181,8 +232,8 @@ class ProgressReporter:
                 "content_type": url.content_type,
                 "content_length": url.content_length,
                 "chunk_count": url.chunk_count,
-                "chunks_uploaded": chunk_counts.get(ChunkStatus.UPLOADED.value, 0),
-                "chunks_failed": chunk_counts.get(ChunkStatus.FAILED.value, 0),
+                "chunks_uploaded": chunk_counts.uploaded,
+                "chunks_failed": chunk_counts.failed,
                 "failure_reason": url.failure_reason,
                 "scraped_at": url.scraped_at.isoformat() if url.scraped_at else None,
                 "processed_at": url.processed_at.isoformat() if url.processed_at else None
@@ -193,26 +244,35 @@ class ProgressReporter:
     @staticmethod
     async def get_failed_chunks(db: AsyncSession, job_id: str) -> List[Dict[str, Any]]:
         """Get all failed chunks for retry"""
+        # Only the preview is reported, so truncate content server-side instead
+        # of materializing full chunk bodies
         result = await db.execute(
-            select(IngestionChunk)
+            select(
+                IngestionChunk.chunk_id,
+                IngestionChunk.chunk_index,
+                func.substr(IngestionChunk.content, 1, 101).label("content_preview"),
+                IngestionChunk.failure_reason,
+                IngestionChunk.retry_count,
+                IngestionChunk.last_retry_at
+            )
             .where(
                 IngestionChunk.job_id == job_id,
-                IngestionChunk.status == ChunkStatus.FAILED.value
+                IngestionChunk.status == _CHUNK_FAILED
             )
         )
-        chunks = result.scalars().all()
-        
+        chunks = result.all()
+
         failed_chunks = []
         for chunk in chunks:
             failed_chunks.append({
                 "chunk_id": chunk.chunk_id,
                 "chunk_index": chunk.chunk_index,
-                "content_preview": chunk.content[:100] + "..." if len(chunk.content) > 100 else chunk.content,
+                "content_preview": chunk.content_preview[:100] + "..." if len(chunk.content_preview) > 100 else chunk.content_preview,
                 "failure_reason": chunk.failure_reason,
                 "retry_count": chunk.retry_count,
                 "last_retry_at": chunk.last_retry_at.isoformat() if chunk.last_retry_at else None
             })
-        
+
         return failed_chunks
     
     @staticmethod
@@ -2,12 +2,15 @@
 Project Deletion Service
 Handles cooperative project deletion with proper cleanup
 """
+import asyncio
 import logging
 from typing import Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import select, update, func
 from datetime import datetime
 
+from app.core.database import AsyncSessionLocal
+
 from app.models.project import Project, ProjectStatus
 from app.models.assistant import Assistant
 from app.models.content import IngestionJob
@@ -48,36 +51,50 @@ class ProjectDeletionService:
             Deletion status
         """
         try:
-            # Get project
+            # Atomic check-and-set: one round-trip marks the project deleting
+            # and closes the race where two concurrent deletions both see ACTIVE
             result = await db.execute(
-                select(Project)
+                update(Project)
                 .where(
                     Project.id == project_id,
-                    Project.tenant_id == tenant_id
+                    Project.tenant_id == tenant_id,
+                    Project.status.notin_([ProjectStatus.DELETING, ProjectStatus.DELETED])
                 )
+                .values(status=ProjectStatus.DELETING)
+                .returning(Project)
             )
             project = result.scalar_one_or_none()
-            
+
             if not project:
-                return {"error": "Project not found or access denied"}
-            
-            if project.status == ProjectStatus.DELETED:
-                return {"error": "Project already deleted"}
-            
-            if project.status == ProjectStatus.DELETING:
+                # Nothing transitioned - distinguish missing from already deleting/deleted
+                status_result = await db.execute(
+                    select(Project.status)
+                    .where(
+                        Project.id == project_id,
+                        Project.tenant_id == tenant_id
+                    )
+                )
+                current_status = status_result.scalar_one_or_none()
+
+                if current_status is None:
+                    return {"error": "Project not found or access denied"}
+
+                if current_status == ProjectStatus.DELETED:
+                    return {"error": "Project already deleted"}
+
                 return {"message": "Project deletion already in progress"}
-            
-            # Mark project as deleting
-            project.status = ProjectStatus.DELETING
+
             await db.commit()
             
             logger.info(f"Project {project_id}: Marked as deleting")
             
-            # Emit audit event
-            EventEmitter.emit_project_deletion(
+            # Emit audit event fire-and-forget - emission may grow a network
+            # backend and must not add latency to the API response
+            asyncio.create_task(asyncio.to_thread(
+                EventEmitter.emit_project_deletion,
                 str(tenant_id), str(project_id), "deleting",
                 {"initiated_at": datetime.utcnow().isoformat()}
-            )
+            ))
             
             # Cancel all running jobs
             cancelled_count = await cancel_all_project_jobs(
@@ -121,39 +138,50 @@ class ProjectDeletionService:
             if project.status != ProjectStatus.DELETING:
                 return {"error": f"Project not in deleting state (current: {project.status.value})"}
             
-            # Check if any jobs are still running
-            running_jobs_result = await db.execute(
-                select(IngestionJob)
-                .where(
-                    IngestionJob.project_id == project_id,
-                    IngestionJob.status.in_(["queued", "running"])
-                )
+            # Check running jobs and fetch assistants concurrently - one round-trip
+            # of wall time instead of two (a session only supports one query at a
+            # time, so the assistants query runs on its own session)
+            async def _fetch_assistants():
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        select(Assistant).where(Assistant.project_id == project_id)
+                    )
+                    return result.scalars().all()
+
+            running_count, assistants = await asyncio.gather(
+                db.scalar(
+                    select(func.count(IngestionJob.id))
+                    .where(
+                        IngestionJob.project_id == project_id,
+                        IngestionJob.status.in_(["queued", "running"])
+                    )
+                ),
+                _fetch_assistants()
             )
-            running_jobs = running_jobs_result.scalars().all()
-            
-            if running_jobs:
+
+            if running_count:
                 return {
                     "error": "Cannot complete deletion - jobs still running",
-                    "running_jobs": len(running_jobs)
+                    "running_jobs": running_count
                 }
             
-            # Get all assistants for vector collection cleanup
-            assistants_result = await db.execute(
-                select(Assistant).where(Assistant.project_id == project_id)
-            )
-            assistants = assistants_result.scalars().all()
-            
-            # Delete vector collections
-            for assistant in assistants:
-                try:
-                    await delete_assistant_collection(
+            # Delete vector collections concurrently - independent Qdrant calls
+            results = await asyncio.gather(
+                *[
+                    delete_assistant_collection(
                         assistant.name,
                         "unknown"  # TODO: Get user name from context
                     )
-                    logger.info(f"Deleted vector collection for assistant {assistant.id}")
-                except Exception as e:
-                    logger.error(f"Error deleting vector collection: {str(e)}")
+                    for assistant in assistants
+                ],
+                return_exceptions=True
+            )
+            for assistant, result in zip(assistants, results):
+                if isinstance(result, Exception):
                     # Continue with deletion even if vector cleanup fails
+                    logger.error(f"Error deleting vector collection: {str(result)}")
+                else:
+                    logger.info(f"Deleted vector collection for assistant {assistant.id}")
             
             # Mark project as deleted (cascade will handle related records)
             project.status = ProjectStatus.DELETED
@@ -162,14 +190,15 @@ class ProjectDeletionService:
             
             logger.info(f"Project {project_id}: Deletion completed")
             
-            # Emit audit event
-            EventEmitter.emit_project_deletion(
+            # Emit audit event fire-and-forget (see initiate_deletion)
+            asyncio.create_task(asyncio.to_thread(
+                EventEmitter.emit_project_deletion,
                 str(project.tenant_id), str(project_id), "deleted",
                 {
                     "deleted_at": project.deleted_at.isoformat(),
                     "assistants_deleted": len(assistants)
                 }
-            )
+            ))
             
             return {
                 "message": "Project deletion completed",
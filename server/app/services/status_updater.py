@@ -4,16 +4,68 @@ Handles status updates and lifecycle management for assistants and jobs
 """
 import asyncio
 import logging
+import time
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select, update, func, true, cast, case, and_, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import OperationalError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, async_engine
 from app.models.assistant import Assistant, AssistantStatus
 from app.models.content import IngestionJob
 
 logger = logging.getLogger(__name__)
 
+# Job statuses that count as still in flight - shared by the monitor logic
+# and SQL filters so the compiled statements stay cacheable
+RUNNING_STATUSES = frozenset({"running", "scraping", "processing", "embedding", "indexing", "storing"})
+
+# Short-TTL cache for sync_assistant_status responses - clients poll the
+# status endpoint far faster than the answer changes, so serve repeats from
+# memory and invalidate on any write path
+_STATUS_CACHE_TTL = 5.0
+_status_cache: dict = {}
+
+# Assistants with a monitor pass already scheduled - prevents a burst of
+# completed jobs from queueing redundant monitor tasks
+_monitor_pending: set = set()
+
+# Single-flight guard: concurrent monitor calls for the same assistant share
+# one DB transaction instead of stampeding
+_monitor_inflight: dict = {}
+
+def _invalidate_status_cache(assistant_id: str) -> None:
+    _status_cache.pop(assistant_id, None)
+
+# Transient DB failures (dropped connections, failovers) get a few jittered
+# retries; everything else propagates so the HTTP layer can translate it
+# instead of the old blanket except-and-return-sentinel handling
+_retry_transient = retry(
+    retry=retry_if_exception_type(OperationalError),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(),
+    reraise=True,
+)
+
+# Progress percentage computed server-side; defined once so SQLAlchemy can
+# cache the compiled statement that embeds it
+_PROGRESS_PERCENTAGE = case(
+    (and_(IngestionJob.total_chunks_created > 0,
+          IngestionJob.current_stage.in_(["ingestion", "storing", "completed"])),
+     cast(func.round(func.coalesce(IngestionJob.chunks_uploaded, 0) * 100.0 /
+                     IngestionJob.total_chunks_created), Integer)),
+    (IngestionJob.total_urls_discovered > 0,
+     cast(func.round((func.coalesce(IngestionJob.urls_processed, 0) +
+                      func.coalesce(IngestionJob.urls_completed, 0)) * 100.0 /
+                     IngestionJob.total_urls_discovered), Integer)),
+    else_=0
+).label("progress_percentage")
+
 class StatusUpdateService:
     """
     Service to monitor and update assistant and job statuses
@@ -28,104 +80,156 @@ class StatusUpdateService:
     def __init__(self):
         pass
     
-    async def monitor_assistant_jobs(self, assistant_id: str) -> bool:
+    async def monitor_assistant_jobs(self, assistant_id: str, db: Optional[AsyncSession] = None) -> bool:
         """
         Monitor all jobs for an assistant and update status accordingly
-        
+
+        Accepts an optional session so callers that already hold one (e.g.
+        sync_assistant_status) don't pay a second pool acquisition
+
+        Concurrent calls for the same assistant are coalesced: the first
+        caller runs the monitor pass, the rest await its result
+
         Returns:
             bool: True if assistant is ready, False if still processing
         """
+        inflight = _monitor_inflight.get(assistant_id)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        _monitor_inflight[assistant_id] = future
         try:
-            async with AsyncSessionLocal() as db:
-                # Get assistant
-                assistant_result = await db.execute(
-                    select(Assistant).where(Assistant.id == assistant_id)
+            result = await self._monitor_assistant_jobs(assistant_id, db)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            _monitor_inflight.pop(assistant_id, None)
+
+    @_retry_transient
+    async def _monitor_assistant_jobs(self, assistant_id: str, db: Optional[AsyncSession] = None) -> bool:
+        """Single monitor pass - see monitor_assistant_jobs"""
+        async with (nullcontext(db) if db is not None else AsyncSessionLocal()) as db:
+            # Fetch the assistant and aggregate its recent jobs in one
+            # round-trip - the DB buckets the statuses and sums the totals,
+            # so no per-job Python loop
+            recent_jobs = (
+                select(
+                    IngestionJob.status,
+                    IngestionJob.total_chunks_created,
+                    (func.coalesce(IngestionJob.urls_processed, 0) +
+                     func.coalesce(IngestionJob.urls_completed, 0)).label("pages_processed")
                 )
-                assistant = assistant_result.scalar_one_or_none()
-                
-                if not assistant:
-                    logger.error(f"Assistant {assistant_id} not found")
-                    return False
-                
-                # Get recent ingestion jobs
-                jobs_result = await db.execute(
-                    select(IngestionJob)
-                    .where(IngestionJob.assistant_id == assistant_id)
-                    .order_by(IngestionJob.started_at.desc())
-                    .limit(5)
+                .where(IngestionJob.assistant_id == assistant_id)
+                .order_by(IngestionJob.started_at.desc())
+                .limit(5)
+                .subquery()
+            )
+            result = await db.execute(
+                select(
+                    Assistant,
+                    func.count(recent_jobs.c.status).label("total_jobs"),
+                    func.count().filter(recent_jobs.c.status == "completed").label("completed_jobs"),
+                    func.count().filter(recent_jobs.c.status == "failed").label("failed_jobs"),
+                    func.count().filter(recent_jobs.c.status.in_(RUNNING_STATUSES)).label("running_jobs"),
+                    func.coalesce(
+                        func.sum(recent_jobs.c.total_chunks_created)
+                        .filter(recent_jobs.c.status == "completed"), 0
+                    ).label("total_chunks"),
+                    func.coalesce(
+                        func.sum(recent_jobs.c.pages_processed)
+                        .filter(recent_jobs.c.status == "completed"), 0
+                    ).label("total_pages")
                 )
-                jobs = jobs_result.scalars().all()
-                
-                if not jobs:
-                    logger.info(f"No jobs found for assistant {assistant_id}")
-                    return assistant.status == AssistantStatus.READY
-                
-                # Check job statuses
-                completed_jobs = 0
-                failed_jobs = 0
-                running_jobs = 0
-                total_chunks = 0
-                total_pages = 0
-                
-                for job in jobs:
-                    if job.status == "completed":
-                        completed_jobs += 1
-                        total_chunks += job.chunks_created or 0
-                        total_pages += job.pages_processed or 0
-                    elif job.status == "failed":
-                        failed_jobs += 1
-                    elif job.status in ["running", "scraping", "processing", "embedding", "indexing", "storing"]:
-                        running_jobs += 1
-                
-                # Update assistant status based on job results
-                if running_jobs > 0:
-                    # Still processing
-                    if assistant.status != AssistantStatus.INGESTING:
-                        assistant.status = AssistantStatus.INGESTING
-                        assistant.status_message = f"Processing content ({running_jobs} jobs running)"
-                        await db.commit()
-                    return False
-                
-                elif completed_jobs > 0 and failed_jobs == 0:
-                    # All jobs completed successfully
-                    assistant.status = AssistantStatus.READY
-                    assistant.status_message = "Assistant is ready for chat"
-                    assistant.total_chunks_indexed = str(total_chunks)
-                    assistant.total_pages_crawled = str(total_pages)
-                    
-                    # Generate system prompt if not exists
-                    if not assistant.system_prompt:
-                        assistant.system_prompt = self._generate_system_prompt(assistant)
-                    
+                .outerjoin(recent_jobs, true())
+                .where(Assistant.id == assistant_id)
+                .group_by(Assistant.id)
+            )
+            row = result.one_or_none()
+
+            if not row:
+                logger.error(f"Assistant {assistant_id} not found")
+                return False
+
+            assistant = row.Assistant
+
+            if not row.total_jobs:
+                logger.info(f"No jobs found for assistant {assistant_id}")
+                return assistant.status == AssistantStatus.READY
+
+            completed_jobs = row.completed_jobs
+            failed_jobs = row.failed_jobs
+            running_jobs = row.running_jobs
+            total_chunks = int(row.total_chunks)
+            total_pages = int(row.total_pages)
+
+            # Update assistant status based on job results
+            if running_jobs > 0:
+                # Still processing
+                if assistant.status != AssistantStatus.INGESTING:
+                    assistant.status = AssistantStatus.INGESTING
+                    assistant.status_message = f"Processing content ({running_jobs} jobs running)"
                     await db.commit()
-                    logger.info(f"Assistant {assistant_id} is now ready with {total_chunks} chunks")
-                    return True
-                
-                elif failed_jobs > 0:
-                    # Some jobs failed
-                    if completed_jobs > 0:
-                        # Partial success
-                        assistant.status = AssistantStatus.READY
-                        assistant.status_message = f"Ready with partial content ({failed_jobs} jobs failed)"
-                        assistant.total_chunks_indexed = str(total_chunks)
-                        assistant.total_pages_crawled = str(total_pages)
-                    else:
-                        # Complete failure
-                        assistant.status = AssistantStatus.ERROR
-                        assistant.status_message = f"Content ingestion failed ({failed_jobs} jobs failed)"
-                    
+                    _invalidate_status_cache(assistant_id)
+                return False
+            
+            elif completed_jobs > 0 and failed_jobs == 0:
+                # All jobs completed successfully - only write when the
+                # desired state actually differs, so repeated polls after
+                # completion stop issuing no-op UPDATEs
+                desired = (AssistantStatus.READY, "Assistant is ready for chat",
+                           str(total_chunks), str(total_pages))
+                current = (assistant.status, assistant.status_message,
+                           assistant.total_chunks_indexed, assistant.total_pages_crawled)
+
+                if current != desired:
+                    (assistant.status, assistant.status_message,
+                     assistant.total_chunks_indexed, assistant.total_pages_crawled) = desired
                     await db.commit()
-                    return assistant.status == AssistantStatus.READY
-                
+                    _invalidate_status_cache(assistant_id)
+                    logger.info(f"Assistant {assistant_id} is now ready with {total_chunks} chunks")
+                return True
+
+            elif failed_jobs > 0:
+                # Some jobs failed
+                if completed_jobs > 0:
+                    # Partial success
+                    desired = (AssistantStatus.READY,
+                               f"Ready with partial content ({failed_jobs} jobs failed)",
+                               str(total_chunks), str(total_pages))
                 else:
-                    # No completed or failed jobs (shouldn't happen)
-                    logger.warning(f"Unexpected job state for assistant {assistant_id}")
-                    return False
-                
-        except Exception as e:
-            logger.error(f"Error monitoring assistant jobs: {str(e)}")
-            return False
+                    # Complete failure
+                    desired = (AssistantStatus.ERROR,
+                               f"Content ingestion failed ({failed_jobs} jobs failed)",
+                               assistant.total_chunks_indexed, assistant.total_pages_crawled)
+
+                current = (assistant.status, assistant.status_message,
+                           assistant.total_chunks_indexed, assistant.total_pages_crawled)
+
+                if current != desired:
+                    (assistant.status, assistant.status_message,
+                     assistant.total_chunks_indexed, assistant.total_pages_crawled) = desired
+                    await db.commit()
+                    _invalidate_status_cache(assistant_id)
+                return assistant.status == AssistantStatus.READY
+            
+            else:
+                # No completed or failed jobs (shouldn't happen)
+                logger.warning(f"Unexpected job state for assistant {assistant_id}")
+                return False
+            
     
+    async def _monitor_and_discard(self, assistant_id: str) -> None:
+        """Run a monitor pass scheduled from update_job_progress"""
+        try:
+            await self.monitor_assistant_jobs(assistant_id)
+        finally:
+            _monitor_pending.discard(assistant_id)
+
+    @_retry_transient
     async def update_job_progress(self, job_id: str) -> Optional[dict]:
         """
         Update job progress and return current status
@@ -133,52 +237,52 @@ class StatusUpdateService:
         Returns:
             dict: Job status information or None if not found
         """
-        try:
-            async with AsyncSessionLocal() as db:
-                # Get job from database
-                job = await db.get(IngestionJob, job_id)
-                
-                if not job:
-                    return None
-
-                urls_total = int(job.total_urls_discovered or 0)
-                urls_processed = int(job.urls_processed or 0)
-                urls_completed = int(job.urls_completed or 0)
-                pages_processed = urls_processed + urls_completed
-
-                total_chunks_created = int(job.total_chunks_created or 0)
-                chunks_uploaded = int(job.chunks_uploaded or 0)
-
-                if total_chunks_created > 0 and (job.current_stage in ["ingestion", "storing", "completed"]):
-                    progress_percentage = int(round((chunks_uploaded / total_chunks_created) * 100))
-                else:
-                    progress_percentage = int(round((pages_processed / urls_total) * 100)) if urls_total > 0 else 0
-                
-                job_status = {
-                    "job_id": str(job.id),
-                    "assistant_id": str(job.assistant_id),
-                    "status": job.status,
-                    "progress_percentage": progress_percentage,
-                    "pages_processed": pages_processed,
-                    "current_stage": job.current_stage,
-                    "urls_discovered": job.total_urls_discovered or 0,
-                    "urls_scraped": job.urls_scraped or 0,
-                    "chunks_created": job.total_chunks_created or 0,
-                    "errors_count": int(job.errors_count or 0),
-                    "started_at": job.started_at.isoformat() if job.started_at else None,
-                    "completed_at": job.completed_at.isoformat() if job.completed_at else None
-                }
-                
-                # Update assistant status if job completed
-                if job.status in ['completed', 'failed']:
-                    await self.monitor_assistant_jobs(str(job.assistant_id))
-                
-                return job_status
+        async with AsyncSessionLocal() as db:
+            # Fetch the job with its progress computed in SQL - one query,
+            # no Python branching or float arithmetic on the poll path
+            result = await db.execute(
+                select(IngestionJob, _PROGRESS_PERCENTAGE)
+                .where(IngestionJob.id == job_id)
+            )
+            row = result.one_or_none()
+
+            if not row:
+                return None
+
+            job = row.IngestionJob
+            pages_processed = int(job.urls_processed or 0) + int(job.urls_completed or 0)
+
+            job_status = {
+                "job_id": str(job.id),
+                "assistant_id": str(job.assistant_id),
+                "status": job.status,
+                "progress_percentage": row.progress_percentage,
+                "pages_processed": pages_processed,
+                "current_stage": job.current_stage,
+                "urls_discovered": job.total_urls_discovered or 0,
+                "urls_scraped": job.urls_scraped or 0,
+                "chunks_created": job.total_chunks_created or 0,
+                "errors_count": int(job.errors_count or 0),
+                # Datetimes stay native - orjson serializes them to ISO-8601
+                # at C speed, so no per-field isoformat() work here
+                "started_at": job.started_at,
+                "completed_at": job.completed_at
+            }
             
-        except Exception as e:
-            logger.error(f"Error updating job progress: {str(e)}")
-            return None
+            # Update assistant status if job completed - fire-and-forget
+            # so the poll response doesn't wait on the monitor round-trips,
+            # with the pending set debouncing bursts of finished jobs
+            if job.status in ['completed', 'failed']:
+                assistant_id = str(job.assistant_id)
+                _invalidate_status_cache(assistant_id)
+                if assistant_id not in _monitor_pending:
+                    _monitor_pending.add(assistant_id)
+                    asyncio.create_task(self._monitor_and_discard(assistant_id))
+            
+            return job_status
+        
     
+    @_retry_transient
     async def sync_assistant_status(self, assistant_id: str) -> dict:
         """
         Synchronize assistant status with current job states
@@ -186,55 +290,75 @@ class StatusUpdateService:
         Returns:
             dict: Current assistant status and job information
         """
-        try:
-            async with AsyncSessionLocal() as db:
-                # Get assistant
-                assistant_result = await db.execute(
-                    select(Assistant).where(Assistant.id == assistant_id)
-                )
-                assistant = assistant_result.scalar_one_or_none()
-                
-                if not assistant:
-                    return {"error": "Assistant not found"}
-                
-                # Monitor jobs and update status
-                is_ready = await self.monitor_assistant_jobs(assistant_id)
-                
-                # Get updated assistant info
-                await db.refresh(assistant)
-                
-                # Get recent jobs
-                jobs_result = await db.execute(
-                    select(IngestionJob)
-                    .where(IngestionJob.assistant_id == assistant_id)
-                    .order_by(IngestionJob.started_at.desc())
-                    .limit(3)
+        cached = _status_cache.get(assistant_id)
+        if cached is not None and time.monotonic() - cached[0] < _STATUS_CACHE_TTL:
+            return cached[1]
+
+        async with AsyncSessionLocal() as db:
+            # Monitor jobs first, then read the assistant once - the read
+            # below already sees the updated status, so the old
+            # SELECT-monitor-refresh sequence collapses from three
+            # assistant round-trips to one
+            is_ready = await self.monitor_assistant_jobs(assistant_id, db=db)
+
+            assistant = await db.get(Assistant, assistant_id)
+
+            if not assistant:
+                return {"error": "Assistant not found"}
+
+            # Get recent jobs as a Core column projection - plain tuples,
+            # no ORM instance construction or identity-map insertion
+            jobs_result = await db.execute(
+                select(
+                    IngestionJob.id,
+                    IngestionJob.status,
+                    IngestionJob.current_stage,
+                    IngestionJob.total_urls_discovered,
+                    IngestionJob.urls_processed,
+                    IngestionJob.urls_completed,
+                    IngestionJob.total_chunks_created,
+                    IngestionJob.chunks_uploaded,
+                    IngestionJob.started_at
                 )
-                recent_jobs = []
-                for job in jobs_result.scalars():
-                    recent_jobs.append({
-                        "job_id": str(job.id),
-                        "status": job.status,
-                        "progress": job.progress_percentage,
-                        "chunks_created": job.chunks_created,
-                        "started_at": job.started_at.isoformat() if job.started_at else None
-                    })
-                
-                return {
-                    "assistant_id": assistant_id,
-                    "status": assistant.status.value,
-                    "status_message": assistant.status_message,
-                    "is_ready": is_ready,
-                    "total_chunks": assistant.total_chunks_indexed,
-                    "total_pages": assistant.total_pages_crawled,
-                    "recent_jobs": recent_jobs,
-                    "last_updated": assistant.updated_at.isoformat() if assistant.updated_at else None
-                }
-                
-        except Exception as e:
-            logger.error(f"Error syncing assistant status: {str(e)}")
-            return {"error": str(e)}
+                .where(IngestionJob.assistant_id == assistant_id)
+                .order_by(IngestionJob.started_at.desc())
+                .limit(3)
+            )
+            recent_jobs = []
+            for row in jobs_result.all():
+                total_chunks_created = int(row.total_chunks_created or 0)
+                chunks_uploaded = int(row.chunks_uploaded or 0)
+                urls_total = int(row.total_urls_discovered or 0)
+                pages_processed = int(row.urls_processed or 0) + int(row.urls_completed or 0)
+
+                if total_chunks_created > 0 and row.current_stage in ["ingestion", "storing", "completed"]:
+                    progress = int(round((chunks_uploaded / total_chunks_created) * 100))
+                else:
+                    progress = int(round((pages_processed / urls_total) * 100)) if urls_total > 0 else 0
+
+                recent_jobs.append({
+                    "job_id": str(row.id),
+                    "status": row.status,
+                    "progress": progress,
+                    "chunks_created": total_chunks_created,
+                    "started_at": row.started_at  # Native datetime - orjson handles it
+                })
+            
+            status_info = {
+                "assistant_id": assistant_id,
+                "status": assistant.status.value,
+                "status_message": assistant.status_message,
+                "is_ready": is_ready,
+                "total_chunks": assistant.total_chunks_indexed,
+                "total_pages": assistant.total_pages_crawled,
+                "recent_jobs": recent_jobs,
+                "last_updated": assistant.updated_at
+            }
+            _status_cache[assistant_id] = (time.monotonic(), status_info)
+            return status_info
+            
     
+    @_retry_transient
     async def cleanup_stale_jobs(self, max_age_hours: int = 24) -> int:
         """
         Clean up stale jobs that have been running too long
@@ -242,51 +366,64 @@ class StatusUpdateService:
         Returns:
             int: Number of jobs cleaned up
         """
-        try:
-            from datetime import datetime, timedelta
-            
-            cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-            cleaned_count = 0
-            
-            async with AsyncSessionLocal() as db:
-                # Find stale jobs
-                stale_jobs_result = await db.execute(
-                    select(IngestionJob)
-                    .where(
-                        IngestionJob.status.in_(["running", "scraping", "processing", "embedding", "indexing", "storing"])
+        from datetime import datetime, timedelta
+        
+        # Bind the clock once - every failed row gets the same timestamp
+        now = datetime.utcnow()
+        cutoff_time = now - timedelta(hours=max_age_hours)
+        error_entry = {
+            "error": "Job timed out - exceeded maximum runtime",
+            "timestamp": now.isoformat(),
+            "cleanup_reason": "stale_job_cleanup"
+        }
+
+        async with AsyncSessionLocal() as db:
+            # Fail all stale jobs in a single UPDATE ... RETURNING instead
+            # of materializing rows and flushing one UPDATE per job; the
+            # error-details append happens server-side on the JSONB column
+            result = await db.execute(
+                update(IngestionJob)
+                .where(
+                    IngestionJob.status.in_(RUNNING_STATUSES)
+                )
+                .where(IngestionJob.started_at < cutoff_time)
+                .values(
+                    status="failed",
+                    completed_at=func.now(),  # Server-side clock, no skew with the trigger timestamping
+                    # jsonb_insert appends the single entry atomically -
+                    # no read-modify-write of the whole array
+                    error_details=func.jsonb_insert(
+                        func.coalesce(IngestionJob.error_details, cast([], JSONB)),
+                        '{-1}',
+                        cast(error_entry, JSONB),
+                        True
                     )
-                    .where(IngestionJob.started_at < cutoff_time)
                 )
-                
-                stale_jobs = stale_jobs_result.scalars().all()
-                
-                for job in stale_jobs:
-                    # Mark as failed
-                    job.status = "failed"
-                    job.error_details = job.error_details or []
-                    job.error_details.append({
-                        "error": "Job timed out - exceeded maximum runtime",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "cleanup_reason": "stale_job_cleanup"
-                    })
-                    job.completed_at = datetime.utcnow()
-                    cleaned_count += 1
-                    
-                    logger.warning(f"Cleaned up stale job {job.id} for assistant {job.assistant_id}")
-                
-                await db.commit()
-                
-                # Update assistant statuses for affected assistants
-                affected_assistants = set(str(job.assistant_id) for job in stale_jobs)
-                for assistant_id in affected_assistants:
-                    await self.monitor_assistant_jobs(assistant_id)
-                
-                return cleaned_count
-                
-        except Exception as e:
-            logger.error(f"Error cleaning up stale jobs: {str(e)}")
-            return 0
+                .returning(IngestionJob.id, IngestionJob.assistant_id)
+                .execution_options(synchronize_session=False)
+            )
+            cleaned_jobs = result.all()
+            await db.commit()
+
+            for job_id, assistant_id in cleaned_jobs:
+                logger.warning(f"Cleaned up stale job {job_id} for assistant {assistant_id}")
+
+            # Re-monitor affected assistants concurrently - each call runs
+            # on its own session, so the fan-out is bounded by the pool
+            affected_assistants = set(str(assistant_id) for _, assistant_id in cleaned_jobs)
+            if affected_assistants:
+                monitor_results = await asyncio.gather(
+                    *[self.monitor_assistant_jobs(assistant_id) for assistant_id in affected_assistants],
+                    return_exceptions=True
+                )
+                for assistant_id, monitor_result in zip(affected_assistants, monitor_results):
+                    if isinstance(monitor_result, Exception):
+                        logger.error(f"Error monitoring assistant {assistant_id}: {str(monitor_result)}")
+
+            return len(cleaned_jobs)
+            
     
+    @_retry_transient
     async def restart_failed_job(self, job_id: str) -> Optional[str]:
         """
         Restart a failed ingestion job
@@ -294,73 +431,114 @@ class StatusUpdateService:
         Returns:
             str: New job ID if successful, None if failed
         """
+        async with AsyncSessionLocal() as db:
+            # PK fetch via the identity map - get() skips statement
+            # compilation and can avoid the round-trip entirely on a hit
+            job = await db.get(
+                IngestionJob, job_id,
+                options=[joinedload(IngestionJob.assistant)]
+            )
+
+            if not job:
+                logger.error(f"Job {job_id} not found")
+                return None
+
+            if job.status != "failed":
+                logger.error(f"Job {job_id} is not in failed state")
+                return None
+
+            assistant = job.assistant
+
+            if not assistant:
+                logger.error(f"Assistant {job.assistant_id} not found")
+                return None
+            
+            # Start new discovery job
+            from app.services.content_discovery import ContentDiscoveryService
+            discovery_service = ContentDiscoveryService()
+            
+            new_job_id = await discovery_service.start_discovery(
+                assistant_id=str(assistant.id),
+                project_id=str(job.project_id),
+                tenant_id=str(job.tenant_id),
+                site_url=assistant.site_url
+            )
+            
+            # Update assistant status
+            assistant.status = AssistantStatus.CREATING
+            assistant.status_message = f"Restarting content discovery (retry of job {job_id})"
+            await db.commit()
+            
+            _invalidate_status_cache(str(assistant.id))
+            logger.info(f"Restarted failed job {job_id} as new job {new_job_id}")
+            return new_job_id
+            
+    
+    async def listen_for_status_changes(self) -> None:
+        """
+        Background task: LISTEN on the assistant_status channel and re-monitor
+        affected assistants when their jobs transition status
+
+        Replaces repeated polling of monitor_assistant_jobs with O(transitions)
+        work - the NOTIFY trigger on ingestion_jobs fires once per status
+        change, and notifications are debounced per assistant before
+        re-monitoring
+        """
+        notifications: asyncio.Queue = asyncio.Queue()
+
+        def _on_notify(connection, pid, channel, payload):
+            notifications.put_nowait(payload)
+
         try:
-            async with AsyncSessionLocal() as db:
-                # Get the failed job
-                job_result = await db.execute(
-                    select(IngestionJob).where(IngestionJob.id == job_id)
-                )
-                job = job_result.scalar_one_or_none()
-                
-                if not job:
-                    logger.error(f"Job {job_id} not found")
-                    return None
-                
-                if job.status != "failed":
-                    logger.error(f"Job {job_id} is not in failed state")
-                    return None
-                
-                # Get assistant
-                assistant_result = await db.execute(
-                    select(Assistant).where(Assistant.id == job.assistant_id)
-                )
-                assistant = assistant_result.scalar_one_or_none()
-                
-                if not assistant:
-                    logger.error(f"Assistant {job.assistant_id} not found")
-                    return None
-                
-                # Start new discovery job
-                from app.services.content_discovery import ContentDiscoveryService
-                discovery_service = ContentDiscoveryService()
-                
-                new_job_id = await discovery_service.start_discovery(
-                    assistant_id=str(assistant.id),
-                    project_id=str(job.project_id),
-                    tenant_id=str(job.tenant_id),
-                    site_url=assistant.site_url
-                )
-                
-                # Update assistant status
-                assistant.status = AssistantStatus.CREATING
-                assistant.status_message = f"Restarting content discovery (retry of job {job_id})"
-                await db.commit()
-                
-                logger.info(f"Restarted failed job {job_id} as new job {new_job_id}")
-                return new_job_id
-                
+            conn = await async_engine.connect()
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.add_listener("assistant_status", _on_notify)
+            logger.info("Listening for assistant status notifications")
         except Exception as e:
-            logger.error(f"Error restarting failed job: {str(e)}")
-            return None
-    
-    def _generate_system_prompt(self, assistant: Assistant) -> str:
-        """Generate system prompt for assistant"""
-        template_prompts = {
-            "support": f"You are a helpful support assistant for {assistant.name}. Help users with technical issues and provide documentation guidance.",
-            "customer": f"You are a customer service assistant for {assistant.name}. Help customers with questions about products and services.",
-            "sales": f"You are a sales assistant for {assistant.name}. Help potential customers understand products and pricing.",
-            "ecommerce": f"You are an e-commerce assistant for {assistant.name}. Help customers find products and get support."
-        }
-        
-        base_prompt = template_prompts.get(assistant.template.value, f"You are an AI assistant for {assistant.name}.")
-        
-        governance_addition = f"""
+            logger.error(f"Could not start assistant status listener: {str(e)}")
+            return
+
+        try:
+            while True:
+                assistant_id = await notifications.get()
+                affected = {assistant_id}
+
+                # Debounce: coalesce notifications for the same assistant that
+                # arrive in a short burst (e.g. many jobs finishing at once)
+                await asyncio.sleep(0.5)
+                while not notifications.empty():
+                    affected.add(notifications.get_nowait())
+
+                for aid in affected:
+                    try:
+                        await self.monitor_assistant_jobs(aid)
+                    except Exception as e:
+                        logger.error(f"Error re-monitoring assistant {aid}: {str(e)}")
+        finally:
+            await conn.close()
+
+# Prompt templates built once at import - identical (template, name, intents)
+# inputs reuse the cached prompt instead of rebuilding the string on every call.
+# System prompts are set eagerly at assistant creation (see the assistant and
+# project routes), keeping the generate-if-missing write off the monitor path
+TEMPLATE_PROMPTS = {
+    "support": "You are a helpful support assistant for {name}. Help users with technical issues and provide documentation guidance.",
+    "customer": "You are a customer service assistant for {name}. Help customers with questions about products and services.",
+    "sales": "You are a sales assistant for {name}. Help potential customers understand products and pricing.",
+    "ecommerce": "You are an e-commerce assistant for {name}. Help customers find products and get support."
+}
+
+@lru_cache(maxsize=1024)
+def build_system_prompt(template: str, name: str, allowed_intents: tuple) -> str:
+    base_prompt = TEMPLATE_PROMPTS.get(template, "You are an AI assistant for {name}.").format(name=name)
+
+    governance_addition = f"""
 
 GOVERNANCE RULES:
 - Only use information from the provided context
 - Always cite sources using provided URLs
-- Allowed content types: {', '.join(assistant.allowed_intents)}
+- Allowed content types: {', '.join(allowed_intents)}
 - If a question is outside your scope, politely decline
 - Maintain strict tenant isolation"""
-        
-        return base_prompt + governance_addition
\ No newline at end of file
+
+    return base_prompt + governance_addition
\ No newline at end of file
@@ -12,23 +12,32 @@ db_url = os.getenv("DATABASE_URL")
 try:
     conn = psycopg2.connect(db_url)
     cursor = conn.cursor()
-    
-    # Get all tables
+
+    # One query for tables and their columns - a per-table round-trip of
+    # information_schema.columns would pay network latency per table
     cursor.execute("""
-        SELECT table_name 
-        FROM information_schema.tables 
-        WHERE table_schema = 'public'
-        ORDER BY table_name
+        SELECT t.table_name, c.column_name, c.data_type, c.is_nullable
+        FROM information_schema.tables t
+        LEFT JOIN information_schema.columns c
+               ON c.table_schema = t.table_schema
+              AND c.table_name = t.table_name
+        WHERE t.table_schema = 'public'
+        ORDER BY t.table_name, c.ordinal_position
     """)
-    
-    tables = cursor.fetchall()
+
     print("\nDatabase Tables:")
     print("="*50)
-    for table in tables:
-        print(f"  - {table[0]}")
-    
+    current_table = None
+    for table_name, column_name, data_type, is_nullable in cursor.fetchall():
+        if table_name != current_table:
+            current_table = table_name
+            print(f"\n  - {table_name}")
+        if column_name:
+            nullable = "NULL" if is_nullable == "YES" else "NOT NULL"
+            print(f"      {column_name}: {data_type} {nullable}")
+
     cursor.close()
     conn.close()
-    
+
 except Exception as e:
     print(f"Error: {e}")
@@ -2,13 +2,19 @@
 Complete cleanup: Delete all assistants and Qdrant collections
 """
 import asyncio
-from sqlalchemy import select, delete
+import os
+from sqlalchemy import select, delete, func, text
 from app.core.database import AsyncSessionLocal
 from app.models.assistant import Assistant
 from app.models.content import IngestionJob, ContentChunk
 from app.models.ingestion_tracking import IngestionURL, IngestionChunk
 from app.core.qdrant_client import get_qdrant_client
 
+# TRUNCATE finishes in O(1) relative to row count and leaves no dead
+# tuples, but needs TRUNCATE privilege and skips row-level triggers -
+# fine for cleanup scripts, opt out if either matters
+USE_TRUNCATE = os.getenv("CLEANUP_USE_TRUNCATE", "1") == "1"
+
 async def cleanup_all():
     print("=" * 60)
     print("COMPLETE CLEANUP: Database + Vector DB")
@@ -17,22 +23,12 @@ async def cleanup_all():
     # 1. Delete from PostgreSQL database
     print("\n[1/2] Cleaning PostgreSQL database...")
     async with AsyncSessionLocal() as db:
-        # Get counts before deletion
-        result = await db.execute(select(Assistant))
-        assistants = result.scalars().all()
-        assistant_count = len(assistants)
-        
-        result = await db.execute(select(IngestionJob))
-        jobs = result.scalars().all()
-        job_count = len(jobs)
-        
-        result = await db.execute(select(ContentChunk))
-        chunks = result.scalars().all()
-        chunk_count = len(chunks)
-        
-        result = await db.execute(select(IngestionURL))
-        urls = result.scalars().all()
-        url_count = len(urls)
+        # Get counts before deletion - COUNT(*) server-side instead of
+        # round-tripping every row and column just to call len()
+        assistant_count = await db.scalar(select(func.count()).select_from(Assistant))
+        job_count = await db.scalar(select(func.count()).select_from(IngestionJob))
+        chunk_count = await db.scalar(select(func.count()).select_from(ContentChunk))
+        url_count = await db.scalar(select(func.count()).select_from(IngestionURL))
         
         print(f"\nFound in database:")
         print(f"  - {assistant_count} assistants")
@@ -45,21 +41,30 @@ async def cleanup_all():
         else:
             print("\nDeleting from database...")
             
-            # Delete in correct order (respecting foreign keys)
-            result = await db.execute(delete(ContentChunk))
-            print(f"  ✓ Deleted {result.rowcount} content chunks")
-            
-            result = await db.execute(delete(IngestionChunk))
-            print(f"  ✓ Deleted {result.rowcount} ingestion chunks")
-            
-            result = await db.execute(delete(IngestionURL))
-            print(f"  ✓ Deleted {result.rowcount} ingestion URLs")
-            
-            result = await db.execute(delete(IngestionJob))
-            print(f"  ✓ Deleted {result.rowcount} ingestion jobs")
-            
-            result = await db.execute(delete(Assistant))
-            print(f"  ✓ Deleted {result.rowcount} assistants")
+            if USE_TRUNCATE:
+                # One statement, no per-row WAL or heap bloat to VACUUM
+                await db.execute(text(
+                    "TRUNCATE content_chunks, ingestion_chunks, "
+                    "ingestion_urls, ingestion_jobs, assistants "
+                    "RESTART IDENTITY CASCADE"
+                ))
+                print("  ✓ Truncated all assistant tables")
+            else:
+                # Delete in correct order (respecting foreign keys)
+                result = await db.execute(delete(ContentChunk))
+                print(f"  ✓ Deleted {result.rowcount} content chunks")
+                
+                result = await db.execute(delete(IngestionChunk))
+                print(f"  ✓ Deleted {result.rowcount} ingestion chunks")
+                
+                result = await db.execute(delete(IngestionURL))
+                print(f"  ✓ Deleted {result.rowcount} ingestion URLs")
+                
+                result = await db.execute(delete(IngestionJob))
+                print(f"  ✓ Deleted {result.rowcount} ingestion jobs")
+                
+                result = await db.execute(delete(Assistant))
+                print(f"  ✓ Deleted {result.rowcount} assistants")
             
             await db.commit()
             print("\n✓ Database cleanup complete!")
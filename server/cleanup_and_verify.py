@@ -2,9 +2,10 @@
 Cleanup all assistants and verify the complete flow is working
 """
 import asyncio
-from sqlalchemy import select, delete
-from qdrant_client import QdrantClient
+from sqlalchemy import select, delete, func
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from app.core.database import AsyncSessionLocal
+from app.core.qdrant_client import collection_name_for
 from app.models.assistant import Assistant
 from app.models.project import Project
 from app.models.content import ContentChunk, IngestionJob
@@ -26,40 +27,43 @@ async def cleanup_all():
         
         print(f"\n✓ Found {len(assistants)} assistants to delete\n")
         
+        # Resolve projects in one query instead of one per assistant
+        project_ids = {a.project_id for a in assistants if a.project_id}
+        projects = {}
+        if project_ids:
+            project_result = await db.execute(
+                select(Project).where(Project.id.in_(project_ids))
+            )
+            projects = {p.id: p for p in project_result.scalars().all()}
+        
+        collection_names = []
         for assistant in assistants:
             print(f"Deleting: {assistant.name} ({assistant.id})")
             print(f"  Status: {assistant.status}")
             print(f"  Chunks: {assistant.total_chunks_indexed}")
             
-            # Delete from Qdrant
-            try:
-                # Get project for collection name
-                project_result = await db.execute(
-                    select(Project).where(Project.id == assistant.project_id)
-                )
-                project = project_result.scalar_one_or_none()
-                
-                if project:
-                    project_name = project.name
-                    user_name = str(assistant.tenant_id)[:8]
-                    safe_project_name = "".join(c.lower() if c.isalnum() else "_" for c in project_name)
-                    safe_user_name = "".join(c.lower() if c.isalnum() else "_" for c in user_name)
-                    collection_name = f"{safe_project_name}_{safe_user_name}"
-                    
-                    print(f"  Deleting Qdrant collection: {collection_name}")
-                    
-                    client = QdrantClient(
-                        url=settings.QDRANT_URL,
-                        api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None
-                    )
-                    
-                    try:
-                        client.delete_collection(collection_name)
-                        print(f"  ✓ Deleted collection: {collection_name}")
-                    except Exception as e:
-                        print(f"  ⚠ Collection may not exist: {e}")
-            except Exception as e:
-                print(f"  ⚠ Error deleting from Qdrant: {e}")
+            project = projects.get(assistant.project_id)
+            if project:
+                user_name = str(assistant.tenant_id)[:8]
+                collection_names.append(collection_name_for(project.name, user_name))
+        
+        # Fan the collection deletes out together - each is an HTTP
+        # round-trip, so N serial deletes cost N RTTs for no reason
+        if collection_names:
+            client = AsyncQdrantClient(
+                url=settings.QDRANT_URL,
+                api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None
+            )
+            results = await asyncio.gather(
+                *(client.delete_collection(name) for name in collection_names),
+                return_exceptions=True
+            )
+            for name, outcome in zip(collection_names, results):
+                if isinstance(outcome, BaseException):
+                    print(f"  ⚠ Collection may not exist: {name}: {outcome}")
+                else:
+                    print(f"  ✓ Deleted collection: {name}")
+            await client.close()
         
         # 2. Delete all chat messages
         print("\n✓ Deleting chat messages...")
@@ -107,35 +111,18 @@ async def verify_cleanup():
     print("="*70 + "\n")
     
     async with AsyncSessionLocal() as db:
-        # Check assistants
-        result = await db.execute(select(Assistant))
-        assistants = result.scalars().all()
-        print(f"Assistants: {len(assistants)} (should be 0)")
-        
-        # Check projects
-        result = await db.execute(select(Project))
-        projects = result.scalars().all()
-        print(f"Projects: {len(projects)} (should be 0)")
-        
-        # Check content chunks
-        result = await db.execute(select(ContentChunk))
-        chunks = result.scalars().all()
-        print(f"Content Chunks: {len(chunks)} (should be 0)")
-        
-        # Check ingestion jobs
-        result = await db.execute(select(IngestionJob))
-        jobs = result.scalars().all()
-        print(f"Ingestion Jobs: {len(jobs)} (should be 0)")
-        
-        # Check chat sessions
-        result = await db.execute(select(ChatSession))
-        sessions = result.scalars().all()
-        print(f"Chat Sessions: {len(sessions)} (should be 0)")
-        
-        # Check chat messages
-        result = await db.execute(select(ChatMessage))
-        messages = result.scalars().all()
-        print(f"Chat Messages: {len(messages)} (should be 0)")
+        # COUNT(*) per table - verification only needs cardinality, not
+        # the rows themselves
+        for label, model in (
+            ("Assistants", Assistant),
+            ("Projects", Project),
+            ("Content Chunks", ContentChunk),
+            ("Ingestion Jobs", IngestionJob),
+            ("Chat Sessions", ChatSession),
+            ("Chat Messages", ChatMessage),
+        ):
+            count = await db.scalar(select(func.count()).select_from(model))
+            print(f"{label}: {count} (should be 0)")
     
     # Check Qdrant collections
     print("\n" + "="*70)
@@ -2,7 +2,7 @@
 Delete all assistants and related data
 """
 import asyncio
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 from app.core.database import AsyncSessionLocal
 from app.models.assistant import Assistant
 from app.models.content import IngestionJob, ContentChunk
@@ -12,14 +12,9 @@ async def delete_all():
     async with AsyncSessionLocal() as db:
         print("Starting deletion of all assistants and related data...")
         
-        # Get count before deletion
-        result = await db.execute(select(Assistant))
-        assistants = result.scalars().all()
-        assistant_count = len(assistants)
-        
-        result = await db.execute(select(IngestionJob))
-        jobs = result.scalars().all()
-        job_count = len(jobs)
+        # Get count before deletion without loading the rows
+        assistant_count = await db.scalar(select(func.count()).select_from(Assistant))
+        job_count = await db.scalar(select(func.count()).select_from(IngestionJob))
         
         print(f"\nFound:")
         print(f"  - {assistant_count} assistants")
@@ -2,12 +2,18 @@
 Delete all assistants and related data - Memory Optimized
 """
 import asyncio
-from sqlalchemy import select, delete
+import os
+from sqlalchemy import select, delete, text
 from app.core.database import AsyncSessionLocal
 from app.models.assistant import Assistant
 from app.models.content import IngestionJob, ContentChunk
 from app.models.ingestion_tracking import IngestionURL, IngestionChunk
 
+# TRUNCATE is O(1) in row count and leaves no dead tuples, but needs
+# TRUNCATE privilege and skips row-level triggers - opt out if either
+# matters
+USE_TRUNCATE = os.getenv("CLEANUP_USE_TRUNCATE", "1") == "1"
+
 async def delete_all():
     async with AsyncSessionLocal() as db:
         print("Starting deletion of all assistants and related data...")
@@ -22,33 +28,44 @@ async def delete_all():
         print(f"  - {assistant_count} assistants")
         print(f"  - {job_count} ingestion jobs")
         
-        # Delete in correct order (respecting foreign keys)
         print("\nDeleting data...")
         
-        # 1. Delete content chunks
-        result = await db.execute(delete(ContentChunk))
-        print(f"  ✓ Deleted {result.rowcount} content chunks")
-        await db.commit()  # Commit after each delete to free memory
-        
-        # 2. Delete ingestion chunks
-        result = await db.execute(delete(IngestionChunk))
-        print(f"  ✓ Deleted {result.rowcount} ingestion chunks")
-        await db.commit()
-        
-        # 3. Delete ingestion URLs
-        result = await db.execute(delete(IngestionURL))
-        print(f"  ✓ Deleted {result.rowcount} ingestion URLs")
-        await db.commit()
-        
-        # 4. Delete ingestion jobs
-        result = await db.execute(delete(IngestionJob))
-        print(f"  ✓ Deleted {result.rowcount} ingestion jobs")
-        await db.commit()
-        
-        # 5. Delete assistants
-        result = await db.execute(delete(Assistant))
-        print(f"  ✓ Deleted {result.rowcount} assistants")
-        await db.commit()
+        if USE_TRUNCATE:
+            # One statement instead of five table scans with per-statement
+            # commits - no per-row WAL, nothing for VACUUM to reclaim
+            await db.execute(text(
+                "TRUNCATE content_chunks, ingestion_chunks, "
+                "ingestion_urls, ingestion_jobs, assistants "
+                "RESTART IDENTITY CASCADE"
+            ))
+            await db.commit()
+            print("  ✓ Truncated all assistant tables")
+        else:
+            # Delete in correct order (respecting foreign keys)
+            # 1. Delete content chunks
+            result = await db.execute(delete(ContentChunk))
+            print(f"  ✓ Deleted {result.rowcount} content chunks")
+            await db.commit()  # Commit after each delete to free memory
+            
+            # 2. Delete ingestion chunks
+            result = await db.execute(delete(IngestionChunk))
+            print(f"  ✓ Deleted {result.rowcount} ingestion chunks")
+            await db.commit()
+            
+            # 3. Delete ingestion URLs
+            result = await db.execute(delete(IngestionURL))
+            print(f"  ✓ Deleted {result.rowcount} ingestion URLs")
+            await db.commit()
+            
+            # 4. Delete ingestion jobs
+            result = await db.execute(delete(IngestionJob))
+            print(f"  ✓ Deleted {result.rowcount} ingestion jobs")
+            await db.commit()
+            
+            # 5. Delete assistants
+            result = await db.execute(delete(Assistant))
+            print(f"  ✓ Deleted {result.rowcount} assistants")
+            await db.commit()
         
         print("\n✅ All assistants and related data deleted successfully!")
         print("\nYou can now create a new assistant from scratch.")
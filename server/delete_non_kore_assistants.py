@@ -16,25 +16,29 @@ if not db_url:
 
 try:
     conn = psycopg2.connect(db_url)
+    # Explicit single-transaction mode: every statement below joins one
+    # transaction and fsyncs once at the final commit
+    conn.autocommit = False
     cursor = conn.cursor()
     
-    # First, get all assistants
-    cursor.execute("""
+    # First, scan all assistants with a server-side cursor - rows stream
+    # in batches instead of materializing the whole table client-side
+    scan_cursor = conn.cursor(name='assistants_scan')
+    scan_cursor.itersize = 500
+    scan_cursor.execute("""
         SELECT id, name, site_url
         FROM assistants
         ORDER BY created_at DESC
     """)
     
-    assistants = cursor.fetchall()
-    
     print(f"\n{'='*80}")
-    print(f"FOUND {len(assistants)} ASSISTANTS")
+    print("SCANNING ASSISTANTS")
     print(f"{'='*80}\n")
     
     assistants_to_delete = []
     kore_ai_id = None
     
-    for assistant in assistants:
+    for assistant in scan_cursor:
         aid, name, site_url = assistant
         
         # Check if this is KoreAI
@@ -45,6 +49,8 @@ try:
             print(f"❌ WILL DELETE: {name} (ID: {aid})")
             assistants_to_delete.append((aid, name))
     
+    scan_cursor.close()
+    
     print(f"\n{'='*80}")
     print(f"ASSISTANTS TO DELETE: {len(assistants_to_delete)}")
     print(f"{'='*80}\n")
@@ -58,60 +64,42 @@ try:
     # Confirm deletion
     print("Proceeding with deletion...\n")
     
+    # Delete everything in one transaction with one statement per table -
+    # ANY(uuid[]) batches all assistants, so N assistants cost 5
+    # round-trips total instead of 6 each
+    aids = [str(aid) for aid, _ in assistants_to_delete]
     deleted_count = 0
-    for aid, name in assistants_to_delete:
-        try:
-            print(f"Deleting assistant: {name} (ID: {aid})")
-            
-            # Delete related records in correct order to avoid foreign key constraint violations
-            
-            # 1. Get all chat sessions for this assistant
-            cursor.execute("SELECT id FROM chat_sessions WHERE assistant_id = %s", (aid,))
-            session_ids = [row[0] for row in cursor.fetchall()]
-            
-            # 2. Delete chat messages for these sessions
-            if session_ids:
-                # Convert to proper UUID array format
-                placeholders = ','.join(['%s'] * len(session_ids))
-                cursor.execute(f"DELETE FROM chat_messages WHERE session_id IN ({placeholders})", session_ids)
-                messages_deleted = cursor.rowcount
-                if messages_deleted > 0:
-                    print(f"  ✓ Deleted {messages_deleted} chat messages")
-            
-            # 3. Delete chat sessions
-            cursor.execute("DELETE FROM chat_sessions WHERE assistant_id = %s", (aid,))
-            sessions_deleted = cursor.rowcount
-            if sessions_deleted > 0:
-                print(f"  ✓ Deleted {sessions_deleted} chat sessions")
-            
-            # 4. Delete ingestion jobs
-            cursor.execute("DELETE FROM ingestion_jobs WHERE assistant_id = %s", (aid,))
-            jobs_deleted = cursor.rowcount
-            if jobs_deleted > 0:
-                print(f"  ✓ Deleted {jobs_deleted} ingestion jobs")
-            
-            # 5. Delete content chunks
-            cursor.execute("DELETE FROM content_chunks WHERE assistant_id = %s", (aid,))
-            chunks_deleted = cursor.rowcount
-            if chunks_deleted > 0:
-                print(f"  ✓ Deleted {chunks_deleted} content chunks")
-            
-            # 6. Finally delete the assistant
-            cursor.execute("DELETE FROM assistants WHERE id = %s", (aid,))
-            
-            # Commit after each successful deletion
-            conn.commit()
-            
-            deleted_count += 1
-            print(f"  ✓ Deleted assistant from database\n")
-            
-        except Exception as e:
-            print(f"  ✗ Error deleting {name}: {e}\n")
-            conn.rollback()
-            continue
-    
-    # Commit all deletions
-    # Already committed in the loop
+    try:
+        cursor.execute(
+            """DELETE FROM chat_messages
+               WHERE session_id IN (
+                   SELECT id FROM chat_sessions WHERE assistant_id = ANY(%s::uuid[])
+               )""",
+            (aids,))
+        if cursor.rowcount > 0:
+            print(f"  ✓ Deleted {cursor.rowcount} chat messages")
+        
+        cursor.execute("DELETE FROM chat_sessions WHERE assistant_id = ANY(%s::uuid[])", (aids,))
+        if cursor.rowcount > 0:
+            print(f"  ✓ Deleted {cursor.rowcount} chat sessions")
+        
+        cursor.execute("DELETE FROM ingestion_jobs WHERE assistant_id = ANY(%s::uuid[])", (aids,))
+        if cursor.rowcount > 0:
+            print(f"  ✓ Deleted {cursor.rowcount} ingestion jobs")
+        
+        cursor.execute("DELETE FROM content_chunks WHERE assistant_id = ANY(%s::uuid[])", (aids,))
+        if cursor.rowcount > 0:
+            print(f"  ✓ Deleted {cursor.rowcount} content chunks")
+        
+        cursor.execute("DELETE FROM assistants WHERE id = ANY(%s::uuid[])", (aids,))
+        deleted_count = cursor.rowcount
+        
+        conn.commit()
+        print(f"  ✓ Deleted {deleted_count} assistants from database\n")
+        
+    except Exception as e:
+        print(f"  ✗ Error deleting assistants: {e}\n")
+        conn.rollback()
     
     print(f"\n{'='*80}")
     print(f"✅ SUCCESSFULLY DELETED {deleted_count} ASSISTANTS")
@@ -2,125 +2,108 @@
 Quick fix script to convert String boolean columns to actual Boolean type
 Run this to fix the database schema issue
 """
+import argparse
 import asyncio
 import sys
 from sqlalchemy import text
 
 sys.path.insert(0, '.')
 
-from app.core.database import engine
+from app.core.database import async_engine as engine
+
+# Per-column conversion: USING expression plus the default to set after the
+# type change. Keys match the information_schema lookup below.
+BOOLEAN_COLUMNS = {
+    'requires_attribution': 'TRUE',
+    'is_policy_content': 'FALSE',
+    'is_sensitive': 'FALSE',
+}
+
+async def fetch_col_info(conn):
+    """Fetch {column: (data_type, default)} for the boolean columns.
+
+    One catalog query serves as existence check, pre-migration type check,
+    and post-migration verification - an empty dict means the table (or its
+    columns) doesn't exist yet.
+    """
+    result = await conn.execute(text("""
+        SELECT column_name, data_type, column_default
+        FROM information_schema.columns
+        WHERE table_name = 'content_chunks'
+        AND column_name = ANY(:cols)
+    """), {"cols": list(BOOLEAN_COLUMNS)})
+    return {row[0]: (row[1], row[2]) for row in result}
+
+async def fix_boolean_columns(verbose=False):
+    """Fix the boolean columns in content_chunks table.
+
+    Returns a dict describing what happened, so callers can assert on the
+    result instead of scraping stdout:
+    {"table_exists": bool, "converted": [cols], "already_boolean": [cols]}
+    """
 
-async def fix_boolean_columns():
-    """Fix the boolean columns in content_chunks table"""
-    
     print("🔧 Fixing boolean columns in content_chunks table...")
-    
+
+    converted = []
+    already_boolean = []
+
     async with engine.begin() as conn:
-        # Check if table exists
-        result = await conn.execute(text("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = 'content_chunks'
-            );
-        """))
-        
-        table_exists = result.scalar()
-        
-        if not table_exists:
+        col_info = await fetch_col_info(conn)
+
+        if not col_info:
             print("✅ Table content_chunks doesn't exist yet - no fix needed")
-            return
-        
-        # Check current column types
-        result = await conn.execute(text("""
-            SELECT column_name, data_type 
-            FROM information_schema.columns 
-            WHERE table_name = 'content_chunks' 
-            AND column_name IN ('requires_attribution', 'is_policy_content', 'is_sensitive');
-        """))
-        
-        columns = {row[0]: row[1] for row in result}
-        
-        print(f"\n📊 Current column types:")
-        for col, dtype in columns.items():
-            print(f"   {col}: {dtype}")
-        
-        # Fix requires_attribution
-        if columns.get('requires_attribution') != 'boolean':
-            print(f"\n🔄 Converting requires_attribution to BOOLEAN...")
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN requires_attribution TYPE BOOLEAN 
-                USING CASE 
-                    WHEN requires_attribution IN ('true', 't', 'yes', '1', 'True') THEN TRUE
-                    WHEN requires_attribution IN ('false', 'f', 'no', '0', 'False') THEN FALSE
-                    ELSE TRUE
-                END
-            """))
-            
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN requires_attribution SET DEFAULT TRUE
-            """))
-            print("   ✅ requires_attribution converted to BOOLEAN")
-        else:
-            print(f"\n✅ requires_attribution is already BOOLEAN")
-        
-        # Fix is_policy_content
-        if columns.get('is_policy_content') != 'boolean':
-            print(f"\n🔄 Converting is_policy_content to BOOLEAN...")
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN is_policy_content TYPE BOOLEAN 
-                USING CASE 
-                    WHEN is_policy_content IN ('true', 't', 'yes', '1', 'True') THEN TRUE
-                    WHEN is_policy_content IN ('false', 'f', 'no', '0', 'False') THEN FALSE
-                    ELSE FALSE
-                END
-            """))
-            
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN is_policy_content SET DEFAULT FALSE
-            """))
-            print("   ✅ is_policy_content converted to BOOLEAN")
-        else:
-            print(f"\n✅ is_policy_content is already BOOLEAN")
-        
-        # Fix is_sensitive
-        if columns.get('is_sensitive') != 'boolean':
-            print(f"\n🔄 Converting is_sensitive to BOOLEAN...")
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN is_sensitive TYPE BOOLEAN 
-                USING CASE 
-                    WHEN is_sensitive IN ('true', 't', 'yes', '1', 'True') THEN TRUE
-                    WHEN is_sensitive IN ('false', 'f', 'no', '0', 'False') THEN FALSE
-                    ELSE FALSE
-                END
-            """))
-            
-            await conn.execute(text("""
-                ALTER TABLE content_chunks 
-                ALTER COLUMN is_sensitive SET DEFAULT FALSE
-            """))
-            print("   ✅ is_sensitive converted to BOOLEAN")
-        else:
-            print(f"\n✅ is_sensitive is already BOOLEAN")
-        
-        # Verify the changes
-        result = await conn.execute(text("""
-            SELECT column_name, data_type, column_default
-            FROM information_schema.columns 
-            WHERE table_name = 'content_chunks' 
-            AND column_name IN ('requires_attribution', 'is_policy_content', 'is_sensitive');
-        """))
-        
-        print(f"\n✅ Final column types:")
-        for row in result:
-            print(f"   {row[0]}: {row[1]} (default: {row[2]})")
-    
+            return {"table_exists": False, "converted": [], "already_boolean": []}
+
+        columns = {col: dtype for col, (dtype, _) in col_info.items()}
+
+        if verbose:
+            print(f"\n📊 Current column types:")
+            for col, dtype in columns.items():
+                print(f"   {col}: {dtype}")
+
+        # Collect every needed conversion into a single ALTER TABLE - each
+        # separate ALTER takes its own ACCESS EXCLUSIVE lock and table scan,
+        # so one statement means one lock window and one rewrite
+        clauses = []
+        for col, default in BOOLEAN_COLUMNS.items():
+            if columns.get(col) == 'boolean':
+                already_boolean.append(col)
+                print(f"\n✅ {col} is already BOOLEAN")
+                continue
+            converted.append(col)
+            print(f"\n🔄 Converting {col} to BOOLEAN...")
+            # ANY(ARRAY[...]) over a lowercased value is a single hashed
+            # array probe per row instead of chained OR comparisons, and
+            # handles TRUE/False/padded variants uniformly
+            clauses.append(f"""
+                ALTER COLUMN {col} TYPE BOOLEAN
+                USING CASE
+                    WHEN lower(trim({col})) = ANY(ARRAY['true', 't', 'yes', '1']) THEN TRUE
+                    WHEN lower(trim({col})) = ANY(ARRAY['false', 'f', 'no', '0']) THEN FALSE
+                    ELSE {default}
+                END""")
+            clauses.append(f"ALTER COLUMN {col} SET DEFAULT {default}")
+
+        if clauses:
+            await conn.execute(text(
+                "ALTER TABLE content_chunks " + ", ".join(clauses)
+            ))
+            print("   ✅ Columns converted to BOOLEAN in one ALTER TABLE")
+
+        # The verification re-query exists only for human confirmation, so
+        # skip the extra catalog round-trip unless explicitly requested
+        if verbose:
+            print(f"\n✅ Final column types:")
+            for col, (dtype, default) in (await fetch_col_info(conn)).items():
+                print(f"   {col}: {dtype} (default: {default})")
+
     print(f"\n🎉 Database schema fixed successfully!")
     print(f"   All boolean columns are now proper BOOLEAN type")
+    return {"table_exists": True, "converted": converted, "already_boolean": already_boolean}
 
 if __name__ == "__main__":
-    asyncio.run(fix_boolean_columns())
+    parser = argparse.ArgumentParser(description="Convert content_chunks boolean columns to BOOLEAN")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print before/after column types (extra catalog query)")
+    args = parser.parse_args()
+    asyncio.run(fix_boolean_columns(verbose=args.verbose))
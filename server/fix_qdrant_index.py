@@ -3,40 +3,40 @@ Fix Qdrant collections by adding assistant_id index
 Run this script to add the missing index to existing collections
 """
 import asyncio
-from qdrant_client import QdrantClient
 from qdrant_client.models import PayloadSchemaType
-from app.core.config import settings
+from app.core.qdrant_client import get_async_qdrant_client
 
 async def fix_qdrant_indexes():
     """Add assistant_id index to all existing collections"""
-    
-    # Initialize Qdrant client
-    client = QdrantClient(
-        url=settings.QDRANT_URL,
-        api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None
-    )
-    
+
+    # Shared client: deploy hooks run this alongside the collection
+    # migration, so both reuse one connection setup
+    client = get_async_qdrant_client()
+
     print("Fetching all collections...")
-    collections = client.get_collections()
-    
-    for collection in collections.collections:
-        collection_name = collection.name
-        print(f"\nProcessing collection: {collection_name}")
-        
-        try:
-            # Create payload index for assistant_id
-            client.create_payload_index(
-                collection_name=collection_name,
-                field_name="assistant_id",
-                field_schema=PayloadSchemaType.KEYWORD
-            )
-            print(f"✓ Created assistant_id index for: {collection_name}")
-        except Exception as e:
-            if "already exists" in str(e).lower():
-                print(f"✓ Index already exists for: {collection_name}")
+    collections = await client.get_collections()
+    collection_names = [c.name for c in collections.collections]
+
+    # Each create_payload_index call is an independent round-trip to Qdrant,
+    # so fire them all at once instead of paying the latency per collection
+    results = await asyncio.gather(
+        *(client.create_payload_index(
+            collection_name=name,
+            field_name="assistant_id",
+            field_schema=PayloadSchemaType.KEYWORD
+        ) for name in collection_names),
+        return_exceptions=True
+    )
+
+    for name, outcome in zip(collection_names, results):
+        if isinstance(outcome, BaseException):
+            if "already exists" in str(outcome).lower():
+                print(f"✓ Index already exists for: {name}")
             else:
-                print(f"✗ Error creating index for {collection_name}: {e}")
-    
+                print(f"✗ Error creating index for {name}: {outcome}")
+        else:
+            print(f"✓ Created assistant_id index for: {name}")
+
     print("\n✅ Finished processing all collections")
 
 if __name__ == "__main__":
@@ -6,17 +6,39 @@ import os
 bind = "0.0.0.0:10000"
 backlog = 64
 
-# Worker processes - keep at 1 for 512MB RAM
+# Worker processes - keep at 1 for 512MB RAM; a 1 GB pod should run 2
 workers = 1
 worker_class = "uvicorn.workers.UvicornWorker"
-worker_connections = 10
-max_requests = 100  # Restart workers after 100 requests to prevent memory leaks
-max_requests_jitter = 10
+# Connection ceiling per worker. 10 throttled async routes that spend
+# most of their time awaiting Qdrant/OpenAI; 1000 is the uvicorn default
+# and connections are cheap coroutines, not threads.
+worker_connections = 1000
+
+# Loop/parser selection: UvicornWorker runs with loop="auto"/http="auto",
+# which picks uvloop and httptools whenever they are importable - and
+# requirements pins uvicorn[standard], which installs both. No explicit
+# config needed (UVICORN_* env vars only affect the uvicorn CLI, not the
+# worker class).
+
+# Worker recycling. Recycling every ~100 requests meant a full
+# Python+FastAPI+SQLAlchemy+Qdrant re-init roughly once per 100 HTTP calls,
+# which dominated latency with cold-start cost. A high ceiling still plateaus
+# RSS growth from heap fragmentation (plateau instead of a tight sawtooth)
+# while paying the restart tax ~100x less often. MEMORY_CONSTRAINED=1
+# restores the old aggressive recycling for very tight deployments.
+if os.getenv("MEMORY_CONSTRAINED") == "1":
+    max_requests = 100
+    max_requests_jitter = 10
+else:
+    max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 10000))
+    max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 1000))
 timeout = 120
 keepalive = 5
 
-# Memory management
-preload_app = False  # Don't preload to save memory
+# Memory management. With a single worker there is no copy-on-write benefit
+# to skipping preload, and preloading means the arbiter pays import cost once
+# instead of every recycled worker paying it again.
+preload_app = workers == 1
 daemon = False
 
 # Logging
@@ -2,39 +2,66 @@
 List all existing assistants and check for KoreAI
 """
 import asyncio
-from sqlalchemy import select
+import sys
+from sqlalchemy import func, select
 from app.core.database import get_db
 from app.models.assistant import Assistant
 
 async def list_assistants():
     async for db in get_db():
         try:
-            # Query all assistants
-            result = await db.execute(select(Assistant))
-            assistants = result.scalars().all()
-            
+            # Count server-side so the total is available up front without
+            # materializing every row
+            total = await db.scalar(select(func.count(Assistant.id)))
+
             print(f"\n{'='*80}")
-            print(f"TOTAL ASSISTANTS: {len(assistants)}")
+            print(f"TOTAL ASSISTANTS: {total}")
             print(f"{'='*80}\n")
-            
+
             kore_ai_found = False
-            
-            for idx, assistant in enumerate(assistants, 1):
-                print(f"{idx}. {assistant.name}")
-                print(f"   ID: {assistant.id}")
-                print(f"   Site URL: {assistant.site_url}")
-                print(f"   Template: {assistant.template}")
-                print(f"   Status: {assistant.status}")
-                print(f"   Is Active: {getattr(assistant, 'is_active', 'N/A')}")
-                print(f"   Created: {assistant.created_at}")
-                print()
-                
+            idx = 0
+
+            # Stream rows through a server-side cursor instead of loading
+            # the whole table into a list - keeps memory flat on big tenants.
+            # Select only the printed columns so wide fields (config blobs,
+            # long text) are never fetched or hydrated into ORM objects.
+            result = await db.stream(
+                select(
+                    Assistant.id,
+                    Assistant.name,
+                    Assistant.site_url,
+                    Assistant.template,
+                    Assistant.status,
+                    Assistant.is_active,
+                    Assistant.created_at,
+                ).execution_options(yield_per=100)
+            )
+            # Buffer row output and flush in batches - per-row print calls
+            # cost ~8 write() syscalls per assistant, which dominates runtime
+            # on large tenants
+            buf = []
+            async for assistant in result:
+                idx += 1
+                buf.append(
+                    f"{idx}. {assistant.name}\n"
+                    f"   ID: {assistant.id}\n"
+                    f"   Site URL: {assistant.site_url}\n"
+                    f"   Template: {assistant.template}\n"
+                    f"   Status: {assistant.status}\n"
+                    f"   Is Active: {assistant.is_active}\n"
+                    f"   Created: {assistant.created_at}\n\n"
+                )
+
                 # Check if this is KoreAI
                 if 'kore' in assistant.name.lower() or 'kore' in assistant.site_url.lower():
                     kore_ai_found = True
-                    print(f"   ⭐ KOREAI FOUND!")
-                    print()
-            
+                    buf.append("   ⭐ KOREAI FOUND!\n\n")
+
+                if len(buf) >= 256:
+                    sys.stdout.write("".join(buf))
+                    buf.clear()
+
+            sys.stdout.write("".join(buf))
             print(f"{'='*80}")
             if kore_ai_found:
                 print("✅ KoreAI assistant EXISTS in the database")
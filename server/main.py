@@ -3,13 +3,14 @@ FlakersStudio Backend - Governance-First AI Assistant Platform
 """
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import os
 from dotenv import load_dotenv
 
 from app.core.config import settings
 from app.api.routes import assistant, chat, auth, projects, analytics, status
-from app.core.database import init_db
+from app.core.database import init_db, warm_up_pool
 from app.core.qdrant_client import init_qdrant
 
 load_dotenv()
@@ -17,22 +18,31 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize services on startup"""
-    # Initialize database
-    await init_db()
-    
-    # Initialize Qdrant
-    await init_qdrant()
-    
+    import asyncio
+    from app.services.status_updater import StatusUpdateService
+
+    # Initialize Postgres and Qdrant concurrently - they hit independent
+    # systems, so cold boot costs max(t_db, t_qdrant) instead of the sum.
+    # Pool warmup follows so the first request burst skips connect latency.
+    await asyncio.gather(init_db(), init_qdrant())
+    await warm_up_pool()
+
+    # Listen for job status transitions instead of polling
+    status_listener = asyncio.create_task(
+        StatusUpdateService().listen_for_status_changes()
+    )
+
     yield
-    
+
     # Cleanup on shutdown
-    pass
+    status_listener.cancel()
 
 app = FastAPI(
     title="FlakersStudio API",
     description="Governance-first AI assistant platform for enterprises",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Faster JSON encoding for polled status/progress endpoints
 )
 
 # CORS middleware
@@ -7,6 +7,23 @@ from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet
 
+def paragraphs(path):
+    """Yield paragraphs from a text file without loading the whole file.
+
+    Reads line-by-line and emits a paragraph at each blank line, so memory
+    stays bounded by the largest single paragraph rather than the file size.
+    """
+    buf = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                buf.append(line)
+            elif buf:
+                yield ''.join(buf).strip()
+                buf.clear()
+    if buf:
+        yield ''.join(buf).strip()
+
 def create_pdf_from_text_files(folder='manual_content'):
     """Create PDF from text files in a folder"""
     if not os.path.exists(folder):
@@ -15,7 +32,12 @@ def create_pdf_from_text_files(folder='manual_content'):
         print("Add .txt files with scraped content to this folder")
         return
     
-    txt_files = [f for f in os.listdir(folder) if f.endswith('.txt')]
+    # scandir enumerates in one pass with cached stat results, and sorting
+    # makes page order deterministic instead of filesystem order
+    txt_files = sorted(
+        e.name for e in os.scandir(folder)
+        if e.is_file() and e.name.endswith('.txt')
+    )
     if not txt_files:
         print(f"No .txt files found in {folder}/")
         return
@@ -23,15 +45,15 @@ def create_pdf_from_text_files(folder='manual_content'):
     doc = SimpleDocTemplate('manual_supplyguard_content.pdf', pagesize=letter)
     story = []
     styles = getSampleStyleSheet()
-    
+    heading = styles['Heading1']
+    body = styles['BodyText']
+
     for txt_file in txt_files:
-        with open(os.path.join(folder, txt_file), 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        story.append(Paragraph(f"<b>{txt_file}</b>", styles['Heading1']))
-        for para in content.split('\n\n'):
-            if para.strip():
-                story.append(Paragraph(para.strip(), styles['BodyText']))
+        story.append(Paragraph(f"<b>{txt_file}</b>", heading))
+        # Stream paragraphs instead of read()-ing the whole file and
+        # splitting it - avoids holding file + split list in memory at once
+        for para in paragraphs(os.path.join(folder, txt_file)):
+            story.append(Paragraph(para, body))
         story.append(PageBreak())
     
     doc.build(story)
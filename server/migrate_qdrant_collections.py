@@ -4,25 +4,93 @@ Migration script to update Qdrant collections for text-embedding-3-large
 """
 import asyncio
 import logging
-from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams
-from app.core.config import settings
+from qdrant_client.models import CreateAlias, CreateAliasOperation, Distance, VectorParams
+from app.core.qdrant_client import get_async_qdrant_client
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cap in-flight migrations so a large tenant doesn't open hundreds of
+# simultaneous requests against Qdrant
+MIGRATE_CONCURRENCY = 8
+
+# Seconds to let in-flight readers finish against the old collection
+# before it is dropped and the name is re-pointed at the new one
+FINALIZE_GRACE_SECONDS = 5.0
+
+async def migrate_one(client, collection_name, sem):
+    """Build the 3072-dim replacement collection if needed.
+
+    Creates the replacement under a versioned name and returns
+    (old_name, new_name) for deferred finalization - the expensive
+    delete of the old HNSW graph happens later, off the hot path.
+    Returns None if the collection is already migrated.
+    """
+    async with sem:
+        # Get collection info to check current vector size
+        try:
+            collection_info = await client.get_collection(collection_name)
+            current_size = collection_info.config.params.vectors.size
+
+            if current_size == 3072:
+                logger.info(f"Collection {collection_name} already has correct dimensions (3072)")
+                return None
+
+            logger.info(f"Collection {collection_name} has {current_size} dimensions, needs migration to 3072")
+
+            # Build the replacement under a versioned name; the old
+            # collection keeps serving reads until finalization
+            # In production, you might want to backup data first
+            logger.warning(f"Vectors in {collection_name} cannot be reused - content must be re-embedded!")
+            new_name = f"{collection_name}__v3072"
+            await client.create_collection(
+                collection_name=new_name,
+                vectors_config=VectorParams(
+                    size=3072,  # text-embedding-3-large dimension
+                    distance=Distance.COSINE
+                )
+            )
+
+            logger.info(f"Created replacement collection {new_name} with 3072 dimensions")
+            return collection_name, new_name
+
+        except Exception as e:
+            logger.error(f"Error migrating collection {collection_name}: {e}")
+            return None
+
+async def finalize_one(client, old_name, new_name):
+    """Drop the old collection and alias its name to the replacement.
+
+    The alias swap is a metadata operation, so lookups under the original
+    name move to the new collection without clients changing anything;
+    only the graph deallocation of the old collection takes time, and it
+    happens here instead of blocking the create path.
+    """
+    try:
+        await client.delete_collection(old_name)
+        await client.update_collection_aliases(
+            change_aliases_operations=[
+                CreateAliasOperation(
+                    create_alias=CreateAlias(
+                        collection_name=new_name,
+                        alias_name=old_name,
+                    )
+                )
+            ]
+        )
+        logger.info(f"Aliased {old_name} -> {new_name}")
+    except Exception as e:
+        logger.error(f"Error finalizing collection {old_name}: {e}")
+
 async def migrate_collections():
     """Migrate Qdrant collections to use 3072 dimensions for text-embedding-3-large"""
     try:
-        # Initialize Qdrant client
-        client = QdrantClient(
-            url=settings.QDRANT_URL,
-            api_key=settings.QDRANT_API_KEY if settings.QDRANT_API_KEY else None
-        )
-        
+        # Shared client from app.core - reused across maintenance scripts
+        client = get_async_qdrant_client()
+
         # Get existing collections
-        collections = client.get_collections()
+        collections = await client.get_collections()
         collection_names = [col.name for col in collections.collections]
         
         logger.info(f"Found existing collections: {collection_names}")
@@ -45,42 +113,26 @@ async def migrate_collections():
             return
         
         logger.info(f"Collections to migrate: {collections_to_migrate}")
-        
-        # Migrate each collection
-        for collection_name in collections_to_migrate:
-            logger.info(f"Migrating collection: {collection_name}")
-            
-            # Get collection info to check current vector size
-            try:
-                collection_info = client.get_collection(collection_name)
-                current_size = collection_info.config.params.vectors.size
-                
-                if current_size == 3072:
-                    logger.info(f"Collection {collection_name} already has correct dimensions (3072)")
-                    continue
-                
-                logger.info(f"Collection {collection_name} has {current_size} dimensions, needs migration to 3072")
-                
-                # For now, we'll delete and recreate the collection
-                # In production, you might want to backup data first
-                logger.warning(f"Deleting collection {collection_name} - all data will be lost!")
-                client.delete_collection(collection_name)
-                
-                # Recreate with correct dimensions
-                client.create_collection(
-                    collection_name=collection_name,
-                    vectors_config=VectorParams(
-                        size=3072,  # text-embedding-3-large dimension
-                        distance=Distance.COSINE
-                    )
-                )
-                
-                logger.info(f"Recreated collection {collection_name} with 3072 dimensions")
-                
-            except Exception as e:
-                logger.error(f"Error migrating collection {collection_name}: {e}")
-                continue
-        
+
+        # Migrate collections concurrently - each one is an independent
+        # info/delete/create sequence against Qdrant, so only the semaphore
+        # bounds how many are in flight at once
+        sem = asyncio.Semaphore(MIGRATE_CONCURRENCY)
+        results = await asyncio.gather(
+            *(migrate_one(client, name, sem) for name in collections_to_migrate),
+            return_exceptions=True
+        )
+
+        # Finalize after a grace period so readers mid-query against the
+        # old collections can drain before their names are re-pointed
+        pending = [r for r in results if isinstance(r, tuple)]
+        if pending:
+            await asyncio.sleep(FINALIZE_GRACE_SECONDS)
+            await asyncio.gather(
+                *(finalize_one(client, old, new) for old, new in pending),
+                return_exceptions=True
+            )
+
         logger.info("Migration completed successfully")
         
     except Exception as e:
@@ -0,0 +1,164 @@
+"""
+Declarative schema manifest for the resumable-pipeline ingestion_jobs columns
+and indexes, shared by add_resumable_pipeline_tables.py and run_migration.py
+so the two can't drift apart.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+
+log = logging.getLogger(__name__)
+
+# Columns the pipeline added to ingestion_jobs: (name, type, default)
+INGESTION_JOBS_COLUMNS = [
+    ("project_id", "UUID", None),
+    ("tenant_id", "UUID", None),
+    ("current_stage", "VARCHAR(50)", None),
+    ("total_urls_discovered", "INTEGER", "0"),
+    ("urls_scraped", "INTEGER", "0"),
+    ("urls_failed_scraping", "INTEGER", "0"),
+    ("urls_processed", "INTEGER", "0"),
+    ("urls_failed_processing", "INTEGER", "0"),
+    ("urls_completed", "INTEGER", "0"),
+    ("urls_partial", "INTEGER", "0"),
+    ("urls_failed", "INTEGER", "0"),
+    ("total_chunks_created", "INTEGER", None),
+    ("chunks_uploaded", "INTEGER", "0"),
+    ("chunks_failed", "INTEGER", "0"),
+    ("chunks_retrying", "INTEGER", "0"),
+    ("cancellation_requested", "BOOLEAN", "FALSE"),
+    ("cancellation_reason", "VARCHAR(500)", None),
+    ("cancelled_at", "TIMESTAMP WITH TIME ZONE", None),
+]
+
+# Indexes on ingestion_jobs for the columns above: (name, "table(cols)")
+INGESTION_JOBS_INDEXES = [
+    ("idx_ingestion_jobs_project", "ingestion_jobs(project_id)"),
+    ("idx_ingestion_jobs_tenant", "ingestion_jobs(tenant_id)"),
+    ("idx_ingestion_jobs_cancellation", "ingestion_jobs(cancellation_requested)"),
+    # BRIN: jobs append in created_at order, so a block-range summary
+    # covers time-range scans at negligible storage cost
+    ("idx_ingestion_jobs_created_brin", "ingestion_jobs USING BRIN (created_at)"),
+]
+
+async def set_ddl_timeouts(conn, lock_timeout="5s", statement_timeout="120s"):
+    """Bound DDL waits with SET LOCAL timeouts (scoped to the transaction).
+
+    Without a lock_timeout an ALTER can queue indefinitely behind inflight
+    ingestion writes while blocking every later write behind itself - the
+    classic lock-queue pileup. Failing fast plus retry_on_lock_timeout is
+    the safe-migration pattern.
+    """
+    await conn.execute(text(f"SET LOCAL lock_timeout = '{lock_timeout}'"))
+    await conn.execute(text(f"SET LOCAL statement_timeout = '{statement_timeout}'"))
+
+def _is_lock_timeout(exc):
+    """True when the exception (or its wrapped DBAPI error) is SQLSTATE 55P03."""
+    for e in (exc, getattr(exc, "orig", None)):
+        if e is not None and "55P03" in (
+            getattr(e, "sqlstate", None) or getattr(e, "pgcode", None) or ""
+        ):
+            return True
+    return False
+
+async def retry_on_lock_timeout(fn, attempts=5):
+    """Run an async callable, retrying with exponential backoff on 55P03.
+
+    Each attempt opens its own transaction inside fn; anything other than a
+    lock-timeout failure propagates immediately.
+    """
+    delay = 1.0
+    for attempt in range(attempts):
+        try:
+            return await fn()
+        except Exception as e:
+            if not _is_lock_timeout(e) or attempt == attempts - 1:
+                raise
+            log.warning("Lock timeout (attempt %d/%d), retrying in %.0fs",
+                        attempt + 1, attempts, delay)
+            await asyncio.sleep(delay)
+            delay *= 2
+
+async def apply_missing_columns(conn, table, columns):
+    """Add every missing column from the manifest in one ALTER TABLE.
+
+    Probes information_schema once, diffs against the declared list, and
+    issues a single multi-clause ALTER - one lock window and one catalog
+    pass no matter how many columns are missing. Returns the names added.
+    """
+    rows = await conn.execute(text(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_name = :table"
+    ), {"table": table})
+    existing = {r[0] for r in rows}
+    missing = [
+        (name, col_type, default)
+        for name, col_type, default in columns
+        if name not in existing
+    ]
+    if missing:
+        clauses = [
+            f"ADD COLUMN {name} {col_type}" + (f" DEFAULT {default}" if default else "")
+            for name, col_type, default in missing
+        ]
+        await conn.execute(text(f"ALTER TABLE {table} " + ", ".join(clauses)))
+    return [name for name, _, _ in missing]
+
+async def apply_columns_individually(engine, table, columns):
+    """Fallback to apply_missing_columns: one autonomous transaction per column.
+
+    Each ADD COLUMN IF NOT EXISTS runs on its own pooled connection, all
+    gathered at once - the ALTERs serialize on the table lock server-side,
+    but a single bad column no longer rolls back every other one the way a
+    shared transaction would. Returns {column_name: exception} for failures.
+    """
+    async def _add(name, col_type, default):
+        ddl = f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {name} {col_type}"
+        if default:
+            ddl += f" DEFAULT {default}"
+        async with engine.connect() as conn:
+            await set_ddl_timeouts(conn)
+            await conn.execute(text(ddl))
+            await conn.commit()
+
+    results = await asyncio.gather(
+        *(_add(*col) for col in columns), return_exceptions=True
+    )
+    return {
+        columns[i][0]: r
+        for i, r in enumerate(results)
+        if isinstance(r, Exception)
+    }
+
+async def apply_indexes_concurrently(engine, indexes):
+    """Build indexes with CREATE INDEX CONCURRENTLY on an autocommit connection.
+
+    CONCURRENTLY cannot run inside a transaction, and Postgres does not
+    support it on partitioned parents at all - those get a plain CREATE
+    INDEX, which cascades to the members (the parents are new enough that
+    there is no live traffic to protect). A failed concurrent build leaves
+    an INVALID index behind; it is dropped and the error re-raised so a
+    broken migration is never reported as success.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        rows = await conn.execute(text(
+            "SELECT relname FROM pg_class WHERE relkind = 'p'"
+        ))
+        partitioned = {r[0] for r in rows}
+        for name, spec in indexes:
+            table = spec.split("(")[0].split(" USING ")[0].strip()
+            if table in partitioned:
+                await conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON {spec}"
+                ))
+                continue
+            try:
+                await conn.execute(text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {spec}"
+                ))
+            except Exception as e:
+                log.warning("Index %s failed (%s), dropping partial build", name, e)
+                await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                raise
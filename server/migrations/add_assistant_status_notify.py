@@ -0,0 +1,50 @@
+"""
+Migration: Add NOTIFY trigger for ingestion job status changes
+Emits pg_notify('assistant_status', assistant_id) whenever a job's status
+transitions, so app instances can LISTEN and re-monitor affected assistants
+instead of polling
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import async_engine
+
+async def add_assistant_status_notify():
+    """Create the notify function and trigger on ingestion_jobs"""
+    async with async_engine.begin() as conn:
+        try:
+            await conn.execute(text("""
+                CREATE OR REPLACE FUNCTION notify_assistant_status() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM pg_notify('assistant_status', NEW.assistant_id::text);
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            print("✓ Created notify_assistant_status() function")
+
+            await conn.execute(text("""
+                DROP TRIGGER IF EXISTS trg_assistant_status_notify ON ingestion_jobs
+            """))
+            await conn.execute(text("""
+                CREATE TRIGGER trg_assistant_status_notify
+                AFTER UPDATE OF status ON ingestion_jobs
+                FOR EACH ROW
+                WHEN (OLD.status IS DISTINCT FROM NEW.status)
+                EXECUTE FUNCTION notify_assistant_status()
+            """))
+            print("✓ Created trg_assistant_status_notify trigger on ingestion_jobs")
+
+        except Exception as e:
+            print(f"✗ Error creating assistant status notify trigger: {e}")
+            raise
+
+if __name__ == "__main__":
+    print("Adding assistant status NOTIFY trigger...")
+    asyncio.run(add_assistant_status_notify())
+    print("Migration complete!")
@@ -14,41 +14,50 @@ from app.core.database import async_engine
 
 async def add_is_active_column():
     """Add is_active column to assistants table"""
-    async with async_engine.begin() as conn:
-        try:
-            # Check if column exists
-            check_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='assistants' AND column_name='is_active'
-            """)
-            result = await conn.execute(check_query)
-            exists = result.fetchone()
-            
-            if exists:
-                print("✓ Column 'is_active' already exists")
-                return
-            
-            # Add the column with default value
+    try:
+        async with async_engine.begin() as conn:
+            # IF NOT EXISTS makes the existence check server-side, so no
+            # information_schema round-trip is needed beforehand
             add_column_query = text("""
-                ALTER TABLE assistants 
-                ADD COLUMN is_active BOOLEAN DEFAULT TRUE
+                ALTER TABLE assistants
+                ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE
             """)
             await conn.execute(add_column_query)
             print("✓ Added 'is_active' column to assistants table")
-            
-            # Update existing records to have is_active = true
-            update_query = text("""
-                UPDATE assistants 
-                SET is_active = TRUE 
-                WHERE is_active IS NULL
-            """)
-            result = await conn.execute(update_query)
-            print(f"✓ Updated {result.rowcount} existing assistants to is_active=true")
-            
-        except Exception as e:
-            print(f"✗ Error adding is_active column: {e}")
-            raise
+
+            # PG 11+ applies a constant DEFAULT on ADD COLUMN as a
+            # metadata-only fast default - existing rows already read as
+            # TRUE, so a backfill UPDATE would just rewrite every row and
+            # burn WAL for nothing. Only older servers need the backfill.
+            version_num = await conn.scalar(
+                text("SELECT current_setting('server_version_num')::int")
+            )
+
+        if version_num >= 110000:
+            print("✓ Fast default covers existing rows (PG 11+), no backfill needed")
+        else:
+            # One transaction per batch: each commit releases its row
+            # locks and bounds the WAL per transaction, so concurrent
+            # traffic only ever waits on the 5000 rows in flight
+            while True:
+                async with async_engine.begin() as conn:
+                    result = await conn.execute(text("""
+                        WITH cte AS (
+                            SELECT id FROM assistants
+                            WHERE is_active IS NULL
+                            LIMIT 5000
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        UPDATE assistants a SET is_active = TRUE
+                        FROM cte WHERE a.id = cte.id
+                    """))
+                if result.rowcount == 0:
+                    break
+                print(f"✓ Backfilled {result.rowcount} assistants to is_active=true")
+
+    except Exception as e:
+        print(f"✗ Error adding is_active column: {e}")
+        raise
 
 if __name__ == "__main__":
     print("Adding is_active column to assistants table...")
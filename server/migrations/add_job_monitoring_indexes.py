@@ -0,0 +1,44 @@
+"""
+Migration: Add indexes backing the status-monitoring queries
+monitor_assistant_jobs and sync_assistant_status do
+WHERE assistant_id = ? ORDER BY started_at DESC LIMIT N, and
+cleanup_stale_jobs filters in-flight statuses older than a cutoff -
+give both an index seek instead of a growing seq-scan + sort
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import async_engine
+
+async def add_job_monitoring_indexes():
+    """Create the monitoring indexes on ingestion_jobs"""
+    async with async_engine.begin() as conn:
+        try:
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_jobs_assistant_started
+                ON ingestion_jobs (assistant_id, started_at DESC)
+            """))
+            print("✓ Ensured index 'ix_jobs_assistant_started'")
+
+            # Partial index keeps the stale-job scan small - only in-flight
+            # rows are indexed
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_jobs_status_started
+                ON ingestion_jobs (status, started_at)
+                WHERE status IN ('running', 'scraping', 'processing', 'embedding', 'indexing', 'storing')
+            """))
+            print("✓ Ensured partial index 'ix_jobs_status_started'")
+
+        except Exception as e:
+            print(f"✗ Error creating job monitoring indexes: {e}")
+            raise
+
+if __name__ == "__main__":
+    print("Adding job monitoring indexes to ingestion_jobs...")
+    asyncio.run(add_job_monitoring_indexes())
+    print("Migration complete!")
@@ -15,25 +15,12 @@ import uuid
 
 async def add_project_id_column():
     """Add project_id column to assistants table"""
-    async with async_engine.begin() as conn:
-        try:
-            # Check if column exists
-            check_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='assistants' AND column_name='project_id'
-            """)
-            result = await conn.execute(check_query)
-            exists = result.fetchone()
-            
-            if exists:
-                print("✓ Column 'project_id' already exists")
-                return
-            
+    try:
+        async with async_engine.begin() as conn:
             # First, create a default project if none exists
             create_project_query = text("""
                 INSERT INTO projects (id, tenant_id, name, description, status, created_at)
-                SELECT 
+                SELECT
                     gen_random_uuid(),
                     tenant_id,
                     'Default Project',
@@ -47,7 +34,7 @@ async def add_project_id_column():
             """)
             result = await conn.execute(create_project_query)
             project_row = result.fetchone()
-            
+
             if project_row:
                 default_project_id = project_row[0]
                 print(f"✓ Created default project: {default_project_id}")
@@ -73,52 +60,83 @@ async def add_project_id_column():
                     })
                     default_project_id = fixed_uuid
                     print(f"✓ Created new default project: {default_project_id}")
-            
-            # Add the column (nullable first)
+
+            # Add the column (nullable first); IF NOT EXISTS keeps the whole
+            # migration rerunnable without a prior information_schema probe
             add_column_query = text("""
-                ALTER TABLE assistants 
-                ADD COLUMN project_id UUID
+                ALTER TABLE assistants
+                ADD COLUMN IF NOT EXISTS project_id UUID
             """)
             await conn.execute(add_column_query)
             print("✓ Added 'project_id' column to assistants table")
-            
-            # Update existing records to use the default project
-            update_query = text("""
-                UPDATE assistants 
-                SET project_id = :project_id
-                WHERE project_id IS NULL
-            """)
-            result = await conn.execute(update_query, {"project_id": default_project_id})
-            print(f"✓ Updated {result.rowcount} existing assistants with project_id")
-            
+
+        # Backfill in bounded batches, one transaction per batch - a single
+        # UPDATE over the whole table holds row locks and writes all its
+        # WAL in one giant transaction. Each batch commits immediately, so
+        # its locks are released and concurrent traffic against assistants
+        # only ever waits on the 5000 rows in flight.
+        #
+        # If this backfill ever needs a per-tenant mapping instead of
+        # one default project, resist the per-row UPDATE loop: send the
+        # whole mapping in one statement by joining against a VALUES
+        # list, e.g.
+        #   UPDATE assistants a SET project_id = v.pid
+        #   FROM (VALUES (:t1, :p1), (:t2, :p2), ...) AS v(tenant_id, pid)
+        #   WHERE a.tenant_id::text = v.tenant_id
+        # which keeps the round-trip count at O(1) in the mapping size.
+        total_updated = 0
+        while True:
+            async with async_engine.begin() as conn:
+                result = await conn.execute(text("""
+                    WITH cte AS (
+                        SELECT id FROM assistants
+                        WHERE project_id IS NULL
+                        LIMIT 5000
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE assistants a SET project_id = :project_id
+                    FROM cte WHERE a.id = cte.id
+                """), {"project_id": default_project_id})
+            if result.rowcount == 0:
+                break
+            total_updated += result.rowcount
+        print(f"✓ Updated {total_updated} existing assistants with project_id")
+
+        async with async_engine.begin() as conn:
             # Make the column NOT NULL
             make_not_null_query = text("""
-                ALTER TABLE assistants 
+                ALTER TABLE assistants
                 ALTER COLUMN project_id SET NOT NULL
             """)
             await conn.execute(make_not_null_query)
             print("✓ Made project_id column NOT NULL")
-            
-            # Add foreign key constraint
+
+            # Add foreign key constraint - ADD CONSTRAINT has no IF NOT
+            # EXISTS form, so swallow duplicate_object server-side instead
             add_fk_query = text("""
-                ALTER TABLE assistants 
-                ADD CONSTRAINT fk_assistants_project 
-                FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE
+                DO $$
+                BEGIN
+                    ALTER TABLE assistants
+                    ADD CONSTRAINT fk_assistants_project
+                    FOREIGN KEY (project_id) REFERENCES projects(id) ON DELETE CASCADE;
+                EXCEPTION WHEN duplicate_object THEN
+                    NULL;
+                END $$
             """)
             await conn.execute(add_fk_query)
             print("✓ Added foreign key constraint")
-            
+
             # Add index
             add_index_query = text("""
-                CREATE INDEX IF NOT EXISTS idx_assistants_project_id 
+                CREATE INDEX IF NOT EXISTS idx_assistants_project_id
                 ON assistants(project_id)
             """)
             await conn.execute(add_index_query)
             print("✓ Added index on project_id")
-            
-        except Exception as e:
-            print(f"✗ Error adding project_id column: {e}")
-            raise
+
+    except Exception as e:
+        print(f"✗ Error adding project_id column: {e}")
+        raise
 
 if __name__ == "__main__":
     print("Adding project_id column to assistants table...")
@@ -0,0 +1,43 @@
+"""
+Migration: Add composite status indexes to ingestion tracking tables
+Backs the hot progress aggregates - every ProgressReporter query filters by
+job_id (or url_id) together with status, so give Postgres covering indexes
+Run this script against databases created before the indexes were added to
+the models
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.core.database import async_engine
+
+INDEXES = [
+    ("idx_url_job_status", "ingestion_urls", "(job_id, status)"),
+    ("idx_chunk_job_status", "ingestion_chunks", "(job_id, status)"),
+    ("idx_url_status", "ingestion_chunks", "(url_id, status)"),
+]
+
+async def add_tracking_status_indexes():
+    """Create the composite (job_id, status) / (url_id, status) indexes"""
+    async with async_engine.begin() as conn:
+        try:
+            for index_name, table_name, columns in INDEXES:
+                create_query = text(f"""
+                    CREATE INDEX IF NOT EXISTS {index_name}
+                    ON {table_name} {columns}
+                """)
+                await conn.execute(create_query)
+                print(f"✓ Ensured index '{index_name}' on {table_name} {columns}")
+
+        except Exception as e:
+            print(f"✗ Error creating tracking status indexes: {e}")
+            raise
+
+if __name__ == "__main__":
+    print("Adding composite status indexes to ingestion tracking tables...")
+    asyncio.run(add_tracking_status_indexes())
+    print("Migration complete!")
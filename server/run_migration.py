@@ -1,131 +1,57 @@
 """
 Quick migration runner to add missing columns to ingestion_jobs
+Thin shim over the shared manifest in migrations/_ingestion_jobs_schema.py,
+so this and add_resumable_pipeline_tables.py can't drift apart.
 """
 import asyncio
-from sqlalchemy import text
+import logging
+
 from app.core.database import async_engine
+from migrations._ingestion_jobs_schema import (
+    INGESTION_JOBS_COLUMNS,
+    INGESTION_JOBS_INDEXES,
+    apply_missing_columns,
+    apply_columns_individually,
+    apply_indexes_concurrently,
+    retry_on_lock_timeout,
+    set_ddl_timeouts,
+)
+
+# Logging instead of print(): no synchronous stdout flush per statement on
+# the event loop, and CI can dial verbosity down to warnings
+log = logging.getLogger(__name__)
 
 async def run_migration():
-    """Add missing columns to ingestion_jobs table"""
-    async with async_engine.begin() as conn:
-        # Add project_id column
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS project_id UUID
-            """))
-            print("✓ Added project_id column")
-        except Exception as e:
-            print(f"project_id: {e}")
-        
-        # Add tenant_id column
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS tenant_id UUID
-            """))
-            print("✓ Added tenant_id column")
-        except Exception as e:
-            print(f"tenant_id: {e}")
-        
-        # Add current_stage column
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS current_stage VARCHAR(50)
-            """))
-            print("✓ Added current_stage column")
-        except Exception as e:
-            print(f"current_stage: {e}")
-        
-        # Add URL tracking columns
-        columns = [
-            "total_urls_discovered INTEGER DEFAULT 0",
-            "urls_scraped INTEGER DEFAULT 0",
-            "urls_failed_scraping INTEGER DEFAULT 0",
-            "urls_processed INTEGER DEFAULT 0",
-            "urls_failed_processing INTEGER DEFAULT 0",
-            "urls_completed INTEGER DEFAULT 0",
-            "urls_partial INTEGER DEFAULT 0",
-            "urls_failed INTEGER DEFAULT 0",
-        ]
-        
-        for col_def in columns:
-            col_name = col_def.split()[0]
-            try:
-                await conn.execute(text(f"""
-                    ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS {col_def}
-                """))
-                print(f"✓ Added {col_name} column")
-            except Exception as e:
-                print(f"{col_name}: {e}")
-        
-        # Add chunk tracking columns
-        chunk_columns = [
-            "total_chunks_created INTEGER",
-            "chunks_uploaded INTEGER DEFAULT 0",
-            "chunks_failed INTEGER DEFAULT 0",
-            "chunks_retrying INTEGER DEFAULT 0",
-        ]
-        
-        for col_def in chunk_columns:
-            col_name = col_def.split()[0]
-            try:
-                await conn.execute(text(f"""
-                    ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS {col_def}
-                """))
-                print(f"✓ Added {col_name} column")
-            except Exception as e:
-                print(f"{col_name}: {e}")
-        
-        # Add cancellation columns
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS cancellation_requested BOOLEAN DEFAULT FALSE
-            """))
-            print("✓ Added cancellation_requested column")
-        except Exception as e:
-            print(f"cancellation_requested: {e}")
-        
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS cancellation_reason VARCHAR(500)
-            """))
-            print("✓ Added cancellation_reason column")
-        except Exception as e:
-            print(f"cancellation_reason: {e}")
-        
-        try:
-            await conn.execute(text("""
-                ALTER TABLE ingestion_jobs ADD COLUMN IF NOT EXISTS cancelled_at TIMESTAMP WITH TIME ZONE
-            """))
-            print("✓ Added cancelled_at column")
-        except Exception as e:
-            print(f"cancelled_at: {e}")
-        
-        # Create indexes
-        try:
-            await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_project ON ingestion_jobs(project_id)
-            """))
-            print("✓ Created project_id index")
-        except Exception as e:
-            print(f"project_id index: {e}")
-        
-        try:
-            await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_tenant ON ingestion_jobs(tenant_id)
-            """))
-            print("✓ Created tenant_id index")
-        except Exception as e:
-            print(f"tenant_id index: {e}")
-        
-        try:
-            await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_cancellation ON ingestion_jobs(cancellation_requested)
-            """))
-            print("✓ Created cancellation_requested index")
-        except Exception as e:
-            print(f"cancellation_requested index: {e}")
-        
-        print("\n✅ Migration completed!")
+    """Add missing columns and indexes to ingestion_jobs table"""
+    async def _batched():
+        # Fast path: one catalog probe, one multi-clause ALTER, with DDL
+        # timeouts so it fails fast instead of queueing behind writers
+        async with async_engine.begin() as conn:
+            await set_ddl_timeouts(conn)
+            return await apply_missing_columns(conn, "ingestion_jobs", INGESTION_JOBS_COLUMNS)
+
+    try:
+        added = await retry_on_lock_timeout(_batched)
+        if added:
+            log.debug("Added columns: %s", ", ".join(added))
+        else:
+            log.debug("All columns already present")
+    except Exception as e:
+        # The batched ALTER is all-or-nothing; retry each column in its
+        # own autonomous transaction so one bad column can't block the rest
+        log.warning("Batched ALTER failed (%s), retrying columns individually", e)
+        failures = await apply_columns_individually(
+            async_engine, "ingestion_jobs", INGESTION_JOBS_COLUMNS
+        )
+        for name, err in failures.items():
+            log.warning("Column %s add failed: %s", name, err)
+        log.debug("Applied %d columns individually",
+                  len(INGESTION_JOBS_COLUMNS) - len(failures))
+
+    await apply_indexes_concurrently(async_engine, INGESTION_JOBS_INDEXES)
+
+    log.info("Migration completed")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(run_migration())
@@ -3,12 +3,15 @@ Enhanced CSV-based website scraper with PDF generation
 Reads URLs from CSV and scrapes all sub-pages, saving to both text and PDF
 """
 import asyncio
+import io
 import sys
 import os
 from datetime import datetime
-import time
 import csv
-from typing import List, Dict, Set
+import re
+import logging
+import logging.handlers
+from typing import Dict, List, Optional, Set
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -24,6 +27,9 @@ except ImportError:
     PDF_AVAILABLE = False
     print("⚠️  ReportLab not installed. Install with: pip install reportlab")
 
+import httpx
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -31,45 +37,231 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode, urlunparse
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Concurrent page fetches per company - coroutines over a shared HTTP
+# client cost kilobytes where a Chrome instance costs tens of MB
+MAX_CONCURRENCY = 10
+
+# Politeness cap: concurrent requests against any single host
+PER_DOMAIN_CONCURRENCY = 4
+
+# Companies scraped in parallel - independent workloads, so the only
+# couplings are total connection count and the shared driver pool
+COMPANY_CONCURRENCY = min(4, os.cpu_count() or 1)
+
+# Fallback browsers for JS-rendered pages, created lazily as needed
+DRIVER_POOL_SIZE = 3
+
+# Single C-loop pass over the text instead of split() materialising a
+# token list that join immediately consumes
+_WS_RE = re.compile(r'\s+')
+
+# Elements whose text never belongs in the scraped content
+_SKIP_TAGS = {'script', 'style', 'nav', 'header', 'footer', 'iframe'}
+
+# Block-level elements whose end marks a paragraph boundary in the
+# extracted text - the boundaries survive whitespace collapsing so the
+# PDF can flow one Paragraph per block
+_BLOCK_TAGS = {
+    'p', 'div', 'section', 'article', 'blockquote', 'pre',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li', 'tr', 'br',
+}
+
+# Non-content extensions never worth a page load
+_ASSET_EXTENSIONS = frozenset({
+    'jpg', 'jpeg', 'png', 'gif', 'svg', 'ico', 'css', 'js',
+    'pdf', 'woff', 'woff2',
+})
+
+# Escapes for reportlab's XML-ish Paragraph markup, applied in one
+# str.translate pass
+_XML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Scroll to the bottom, then return as soon as the DOM has been quiet for
+# 400 ms (MutationObserver), capped at 2.5 s. Replaces fixed sleeps that
+# charged every page the worst-case wait.
+_DOM_QUIET_SCRIPT = """
+const cb = arguments[arguments.length - 1];
+let t;
+const mo = new MutationObserver(() => {
+    clearTimeout(t);
+    t = setTimeout(() => { mo.disconnect(); cb(true); }, 400);
+});
+mo.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, document.body.scrollHeight);
+t = setTimeout(() => { mo.disconnect(); cb(true); }, 2500);
+"""
+
+# Per-page progress goes through a buffered logger rather than print():
+# a filtered logger.debug is orders of magnitude cheaper than a stdout
+# flush per line, and the memory handler only hits disk in batches
+log = logging.getLogger('scraper')
+
+def _configure_logging(output_directory: str):
+    """Buffer per-page log records in memory, flushing to scrape.log"""
+    if log.handlers:
+        return
+    log.setLevel(logging.DEBUG)
+    file_handler = logging.FileHandler(os.path.join(output_directory, 'scrape.log'))
+    file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    log.addHandler(logging.handlers.MemoryHandler(
+        1024, flushLevel=logging.ERROR, target=file_handler,
+    ))
+
+def _canonical_url(url: str) -> str:
+    """Canonical form for deduplication
+
+    The same page commonly appears with and without a trailing slash,
+    with index.html, or with query params in different orders - raw-string
+    dedup counts each variant as a new page and wastes a full load on it.
+    """
+    p = urlparse(url)
+    path = p.path
+    if path.endswith('/index.html'):
+        path = path[:-len('index.html')]
+    path = path.rstrip('/') or '/'
+    query = urlencode(sorted(parse_qsl(p.query)))
+    return urlunparse((p.scheme, p.netloc.lower(), path, '', query, ''))
+
+class _TextTarget:
+    """Streaming lxml target collecting the title and visible text
+
+    A DOM parse holds the whole element tree in memory just to read its
+    text; the target interface receives events as the parser streams the
+    document, so peak memory is the size of the extracted text, not the
+    tree.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._title = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._title_done = False
+
+    def start(self, tag, attrib):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'title' and not self._title_done:
+            self._in_title = True
+
+    def end(self, tag):
+        if tag in _SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == 'title' and self._in_title:
+            self._in_title = False
+            self._title_done = True
+        elif tag in _BLOCK_TAGS and not self._skip_depth:
+            self._chunks.append('\n\n')
+
+    def data(self, text):
+        if self._in_title:
+            self._title.append(text)
+        elif not self._skip_depth:
+            self._chunks.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return ''.join(self._title).strip(), ' '.join(self._chunks)
+
+def _needs_js(html: str) -> bool:
+    """Heuristic: does this HTML look like a JS-rendered shell?
+
+    Only suspiciously small documents or explicit noscript sentinels are
+    worth the seconds a Selenium fallback costs.
+    """
+    return len(html) < 500 or '<noscript' in html.lower()
 
 class CSVWebsiteScraper:
-    """Scraper that reads URLs from CSV and scrapes all sub-pages"""
-    
+    """Scraper that reads URLs from CSV and scrapes all sub-pages
+
+    Pages are fetched concurrently over a shared httpx.AsyncClient - the
+    workload is network-bound, so gathering N fetches under a semaphore
+    replaces N sequential browser round-trips. Selenium is kept only as a
+    per-page fallback for JS-rendered sites, started lazily on first use.
+    """
+
     def __init__(self, csv_file_path: str, output_directory: str):
         self.csv_file_path = csv_file_path
         self.output_directory = output_directory
-        self.driver = None
         self.company_data = {}
         self.visited_urls = set()
-        
+        # Pool of fallback drivers, created lazily up to DRIVER_POOL_SIZE
+        # so several JS pages can render concurrently
+        self._driver_pool = asyncio.Queue()
+        self._drivers_created = 0
+        self._driver_create_lock = asyncio.Lock()
+        # Per-host politeness - replaces the old fixed sleep between pages
+        self._domain_semaphores = {}
+
+        # PDF styles are identical for every company - build them once
+        # instead of five ParagraphStyles plus a stylesheet per call
+        if PDF_AVAILABLE:
+            styles = getSampleStyleSheet()
+            self._pdf_styles = {
+                'title': ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, textColor=colors.HexColor('#1a1a1a'), spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold'),
+                'subtitle': ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, textColor=colors.HexColor('#555555'), spaceAfter=20, alignment=TA_CENTER),
+                'h1': ParagraphStyle('H1', parent=styles['Heading1'], fontSize=16, textColor=colors.HexColor('#2c3e50'), spaceAfter=10, spaceBefore=12, fontName='Helvetica-Bold'),
+                'body': ParagraphStyle('Body', parent=styles['BodyText'], fontSize=10, alignment=TA_JUSTIFY, spaceAfter=10, leading=14),
+                'url': ParagraphStyle('URL', parent=styles['BodyText'], fontSize=9, textColor=colors.HexColor('#0066cc'), spaceAfter=8),
+            }
+            self._pdf_table_style = TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('PADDING', (0, 0), (-1, -1), 10),
+                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ])
+
         # Create output directory
         if not os.path.exists(output_directory):
             os.makedirs(output_directory)
             print(f"✅ Created output directory: {output_directory}")
-    
-    def setup_driver(self):
-        """Setup Chrome WebDriver"""
+
+        _configure_logging(output_directory)
+
+    def _build_driver(self):
+        """Build one Chrome WebDriver for the fallback pool"""
         chrome_options = Options()
         chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+
+        # Text scraper: images and stylesheets are pure bandwidth waste,
+        # typically most of the bytes on a page
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "permissions.default.stylesheet": 2,
+        })
+        # Return from get() at DOMContentLoaded instead of waiting for
+        # every subresource - the scroll/sleep phase covers lazy content
+        chrome_options.page_load_strategy = 'eager'
+
+        # Pin CHROMEDRIVER_PATH to skip the manager's network check on
+        # warm runs
+        driver_path = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+        service = Service(driver_path)
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
             "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
         })
-        
-        self.driver.set_page_load_timeout(60)
+
+        driver.set_page_load_timeout(60)
+        return driver
     
     def read_csv(self):
         """Read company names and URLs from CSV"""
@@ -78,18 +270,35 @@ class CSVWebsiteScraper:
         company_urls = {}
         
         try:
-            with open(self.csv_file_path, 'r', encoding='utf-8') as csv_file:
-                csv_reader = csv.DictReader(csv_file)
-                
+            # Plain csv.reader over a 1 MB buffer: no dict built per row,
+            # and the fallback column names resolve once against the
+            # header instead of three .get() probes per row
+            with open(self.csv_file_path, 'rb', buffering=1 << 20) as raw:
+                csv_file = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+                csv_reader = csv.reader(csv_file)
+
+                header = next(csv_reader, None)
+                if header is None:
+                    print("❌ Error reading CSV: empty file")
+                    return {}
+
+                # Support 'NAME'/'name'/'Company' and 'URL'/'url'/'Website'
+                lookup = {name.strip().lower(): i for i, name in enumerate(header)}
+                name_idx = next((lookup[k] for k in ('name', 'company') if k in lookup), None)
+                url_idx = next((lookup[k] for k in ('url', 'website') if k in lookup), None)
+                if name_idx is None or url_idx is None:
+                    print("❌ Error reading CSV: no NAME/URL columns found")
+                    return {}
+
+                min_width = max(name_idx, url_idx) + 1
                 for row in csv_reader:
-                    # Support both 'NAME' and 'name' columns
-                    company_name = row.get('NAME') or row.get('name') or row.get('Company')
-                    url = row.get('URL') or row.get('url') or row.get('Website')
-                    
+                    if len(row) < min_width:
+                        continue
+                    company_name = row[name_idx]
+                    url = row[url_idx]
+
                     if company_name and url:
-                        if company_name not in company_urls:
-                            company_urls[company_name] = set()
-                        company_urls[company_name].add(url)
+                        company_urls.setdefault(company_name, set()).add(url)
             
             print(f"✅ Found {len(company_urls)} companies")
             for company, urls in company_urls.items():
@@ -101,89 +310,192 @@ class CSVWebsiteScraper:
             print(f"❌ Error reading CSV: {str(e)}")
             return {}
     
-    def get_sub_urls(self, base_url: str) -> Set[str]:
-        """Get all sub-URLs from a page"""
+    async def _acquire_driver(self):
+        """Check a fallback driver out of the pool, growing it lazily"""
+        if not self._driver_pool.empty():
+            return await self._driver_pool.get()
+        async with self._driver_create_lock:
+            if self._drivers_created < DRIVER_POOL_SIZE:
+                print("   🚀 Starting browser for JS fallback...")
+                driver = await asyncio.to_thread(self._build_driver)
+                self._drivers_created += 1
+                return driver
+        # Pool is at capacity - wait for a driver to come back
+        return await self._driver_pool.get()
+
+    def _domain_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Politeness semaphore for the URL's host"""
+        domain = urlparse(url).netloc
+        if domain not in self._domain_semaphores:
+            self._domain_semaphores[domain] = asyncio.Semaphore(PER_DOMAIN_CONCURRENCY)
+        return self._domain_semaphores[domain]
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """Fetch a page over plain HTTP, returning HTML or None"""
         try:
-            self.driver.get(base_url)
-            
+            async with self._domain_semaphore(url):
+                response = await client.get(url)
+            response.raise_for_status()
+            return response.text
+        except httpx.HTTPError as e:
+            log.warning("Fetch failed for %s: %s", url, e)
+            return None
+
+    def _extract_sub_urls(self, base_url: str, html: str) -> Set[str]:
+        """Collect same-domain links from an HTML document
+
+        Links are deduplicated by canonical form so slash/index.html/query-
+        order variants of one page cost a single load; asset links are
+        skipped outright.
+        """
+        tree = lxml.html.fromstring(html)
+        return self._filter_sub_urls(base_url, tree.xpath('//a/@href'))
+
+    def _filter_sub_urls(self, base_url: str, hrefs) -> Set[str]:
+        """Resolve, filter and canonically dedupe raw href values"""
+        seen = {}
+        base_domain = urlparse(base_url).netloc
+
+        for href in hrefs:
+            # Make absolute URL
+            absolute_url = urljoin(base_url, href)
+            parsed = urlparse(absolute_url)
+
+            # Only include URLs from same domain
+            if parsed.netloc != base_domain:
+                continue
+
+            # Skip non-content assets
+            tail = parsed.path.rsplit('/', 1)[-1]
+            if '.' in tail and tail.rsplit('.', 1)[-1].lower() in _ASSET_EXTENSIONS:
+                continue
+
+            # Remove fragments; keep the first original spelling per
+            # canonical form for navigation
+            clean_url = absolute_url.split('#')[0]
+            if clean_url:
+                seen.setdefault(_canonical_url(clean_url), clean_url)
+
+        return set(seen.values())
+
+    async def get_sub_urls(self, client: httpx.AsyncClient, base_url: str) -> Set[str]:
+        """Get all sub-URLs from a page
+
+        HTTP + lxml first; the Selenium path only runs when the response
+        looks like a JS-rendered shell.
+        """
+        html = await self._fetch(client, base_url)
+        if html is not None and not _needs_js(html):
+            try:
+                return self._extract_sub_urls(base_url, html)
+            except Exception as e:
+                log.warning("Error getting sub-URLs for %s: %s", base_url, e)
+                return set()
+
+        driver = await self._acquire_driver()
+        try:
+            return await asyncio.to_thread(self._get_sub_urls_selenium, driver, base_url)
+        finally:
+            await self._driver_pool.put(driver)
+
+    @staticmethod
+    def _wait_for_dom_quiet(driver):
+        """Scroll to the bottom and block until the DOM settles"""
+        driver.set_script_timeout(5)
+        try:
+            driver.execute_async_script(_DOM_QUIET_SCRIPT)
+        except Exception:
+            # A page that breaks the observer just proceeds immediately
+            pass
+
+    def _get_sub_urls_selenium(self, driver, base_url: str) -> Set[str]:
+        """Selenium fallback for JS-rendered link discovery"""
+        try:
+            driver.get(base_url)
+
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            
-            # Wait a bit for JavaScript
-            time.sleep(3)
-            
-            # Get all links
-            links = self.driver.find_elements(By.TAG_NAME, 'a')
-            sub_urls = set()
-            
-            base_domain = urlparse(base_url).netloc
-            
-            for link in links:
-                try:
-                    href = link.get_attribute('href')
-                    if href:
-                        # Make absolute URL
-                        absolute_url = urljoin(base_url, href)
-                        
-                        # Only include URLs from same domain
-                        if urlparse(absolute_url).netloc == base_domain:
-                            # Remove fragments
-                            clean_url = absolute_url.split('#')[0]
-                            if clean_url and clean_url not in sub_urls:
-                                sub_urls.add(clean_url)
-                except:
-                    continue
-            
-            return sub_urls
-            
+
+            # Wait until JS stops mutating the DOM instead of a flat sleep
+            self._wait_for_dom_quiet(driver)
+
+            # One CDP round-trip returning just the hrefs - no per-element
+            # get_attribute traffic and no full-DOM serialization
+            hrefs = driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href]'), a => a.href);"
+            )
+            return self._filter_sub_urls(base_url, hrefs)
+
         except Exception as e:
-            print(f"   ⚠️  Error getting sub-URLs: {str(e)}")
+            log.warning("Error getting sub-URLs for %s: %s", base_url, e)
             return set()
-    
-    def scrape_page(self, url: str) -> Dict:
-        """Scrape a single page"""
+
+    def _extract_page(self, url: str, html: str) -> Dict:
+        """Extract title and text content from an HTML document
+
+        Streams the document through a target parser - no element tree is
+        ever built, only the title and visible-text chunks accumulate.
+        """
+        parser = lxml.etree.HTMLParser(target=_TextTarget())
+        parser.feed(html)
+        title, text = parser.close()
+
+        title = title or url
+        # Collapse whitespace within each block but keep the block
+        # boundaries _TextTarget emits - they become the paragraph breaks
+        # the save paths flow on
+        text_content = '\n\n'.join(
+            b for b in (_WS_RE.sub(' ', block).strip() for block in text.split('\n\n'))
+            if b
+        )
+
+        return {
+            'url': url,
+            'title': title,
+            'content': text_content,
+            # Length is read repeatedly downstream (filters, summaries,
+            # PDF truncation) - compute it once here
+            'content_len': len(text_content),
+            'scraped_at': datetime.now()
+        }
+
+    async def scrape_page(self, client: httpx.AsyncClient, url: str) -> Optional[Dict]:
+        """Scrape a single page, falling back to Selenium for JS shells"""
+        html = await self._fetch(client, url)
+        if html is not None and not _needs_js(html):
+            try:
+                return self._extract_page(url, html)
+            except Exception as e:
+                log.warning("Error scraping %s: %s", url, e)
+                return None
+
+        driver = await self._acquire_driver()
         try:
-            self.driver.get(url)
-            
+            return await asyncio.to_thread(self._scrape_page_selenium, driver, url)
+        finally:
+            await self._driver_pool.put(driver)
+
+    def _scrape_page_selenium(self, driver, url: str) -> Optional[Dict]:
+        """Selenium fallback for JS-rendered pages"""
+        try:
+            driver.get(url)
+
             # Wait for content
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            
-            # Scroll to load lazy content
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-            time.sleep(1)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
-            # Get HTML
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract title
-            title = soup.title.get_text().strip() if soup.title else url
-            
-            # Remove unwanted elements
-            for unwanted in soup(['script', 'style', 'nav', 'header', 'footer', 'iframe']):
-                unwanted.decompose()
-            
-            # Get text content
-            text_content = soup.get_text(separator=' ', strip=True)
-            text_content = ' '.join(text_content.split())
-            
-            return {
-                'url': url,
-                'title': title,
-                'content': text_content,
-                'scraped_at': datetime.now()
-            }
-            
+
+            # One scroll to the bottom, then return as soon as lazy-loaded
+            # content stops arriving - the old three-scroll pattern slept
+            # a fixed 4 s per page regardless of what the page did
+            self._wait_for_dom_quiet(driver)
+
+            return self._extract_page(url, driver.page_source)
+
         except Exception as e:
-            print(f"   ❌ Error scraping {url}: {str(e)}")
+            log.warning("Error scraping %s: %s", url, e)
             return None
     
     def save_to_text_file(self, company_name: str, pages: List[Dict]):
@@ -191,20 +503,23 @@ class CSVWebsiteScraper:
         file_path = os.path.join(self.output_directory, f"{company_name}.txt")
         
         try:
+            # Assemble the document in memory and write it in one call
+            # instead of issuing 8+ small writes per page
+            rule = "=" * 80
+            out = io.StringIO()
+            out.write(f"Company: {company_name}\n")
+            out.write(f"Scraped: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            out.write(f"Total Pages: {len(pages)}\n")
+            out.write(rule + "\n\n")
+
+            for i, page in enumerate(pages, 1):
+                out.write(f"\n{rule}\nPAGE {i}: {page['title']}\nURL: {page['url']}\n{rule}\n\n")
+                out.write(page['content'])
+                out.write("\n\n")
+
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"Company: {company_name}\n")
-                f.write(f"Scraped: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total Pages: {len(pages)}\n")
-                f.write("="*80 + "\n\n")
-                
-                for i, page in enumerate(pages, 1):
-                    f.write(f"\n{'='*80}\n")
-                    f.write(f"PAGE {i}: {page['title']}\n")
-                    f.write(f"URL: {page['url']}\n")
-                    f.write(f"{'='*80}\n\n")
-                    f.write(page['content'])
-                    f.write("\n\n")
-            
+                f.write(out.getvalue())
+
             print(f"   💾 Saved text file: {file_path}")
             return True
             
@@ -222,22 +537,20 @@ class CSVWebsiteScraper:
         try:
             doc = SimpleDocTemplate(file_path, pagesize=letter, rightMargin=60, leftMargin=60, topMargin=60, bottomMargin=30)
             story = []
-            styles = getSampleStyleSheet()
-            
-            # Styles
-            title_style = ParagraphStyle('Title', parent=styles['Heading1'], fontSize=24, textColor=colors.HexColor('#1a1a1a'), spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold')
-            subtitle_style = ParagraphStyle('Subtitle', parent=styles['Heading2'], fontSize=14, textColor=colors.HexColor('#555555'), spaceAfter=20, alignment=TA_CENTER)
-            h1_style = ParagraphStyle('H1', parent=styles['Heading1'], fontSize=16, textColor=colors.HexColor('#2c3e50'), spaceAfter=10, spaceBefore=12, fontName='Helvetica-Bold')
-            body_style = ParagraphStyle('Body', parent=styles['BodyText'], fontSize=10, alignment=TA_JUSTIFY, spaceAfter=10, leading=14)
-            url_style = ParagraphStyle('URL', parent=styles['BodyText'], fontSize=9, textColor=colors.HexColor('#0066cc'), spaceAfter=8)
-            
+            # Shared styles built once in __init__
+            title_style = self._pdf_styles['title']
+            subtitle_style = self._pdf_styles['subtitle']
+            h1_style = self._pdf_styles['h1']
+            body_style = self._pdf_styles['body']
+            url_style = self._pdf_styles['url']
+
             # Title page
             story.append(Paragraph(company_name, title_style))
             story.append(Paragraph("Website Content Report", subtitle_style))
             story.append(Spacer(1, 0.3*inch))
             
             # Metadata
-            total_chars = sum(len(p['content']) for p in pages)
+            total_chars = sum(p['content_len'] for p in pages)
             metadata = [
                 ['Generated:', datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
                 ['Company:', company_name],
@@ -246,16 +559,8 @@ class CSVWebsiteScraper:
             ]
             
             table = Table(metadata, colWidths=[2*inch, 4*inch])
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#ecf0f1')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ]))
-            
+            table.setStyle(self._pdf_table_style)
+
             story.append(table)
             story.append(PageBreak())
             
@@ -267,17 +572,19 @@ class CSVWebsiteScraper:
                 
                 # Content (limit to 3000 chars per page for PDF)
                 content = page['content'][:3000]
-                if len(page['content']) > 3000:
+                if page['content_len'] > 3000:
                     content += "... (truncated for PDF)"
                 
-                content = content.replace('<', '&lt;').replace('>', '&gt;')
-                
-                # Split into chunks
-                chunk_size = 500
-                for j in range(0, len(content), chunk_size):
-                    chunk = content[j:j+chunk_size]
-                    if chunk.strip():
-                        story.append(Paragraph(chunk, body_style))
+                # Single-pass escape; translate also covers & which the
+                # old chained .replace calls missed
+                content = content.translate(_XML_ESCAPES)
+
+                # Flow natural paragraphs instead of arbitrary 500-char
+                # slices that broke words and sentences mid-stream
+                for para in content.split('\n\n'):
+                    para = para.strip()
+                    if para:
+                        story.append(Paragraph(para, body_style))
                 
                 if i < len(pages):
                     story.append(PageBreak())
@@ -292,51 +599,64 @@ class CSVWebsiteScraper:
             print(f"   ❌ Error saving PDF: {str(e)}")
             return False
     
-    def scrape_company(self, company_name: str, base_urls: Set[str], max_pages: int = 20):
+    async def scrape_company(self, client: httpx.AsyncClient, company_name: str,
+                             base_urls: Set[str], max_pages: int = 20):
         """Scrape all pages for a company"""
         print(f"\n{'='*70}")
         print(f"🏢 SCRAPING: {company_name}")
         print('='*70)
-        
+
         all_pages = []
         urls_to_scrape = set()
-        
-        # Get sub-URLs from all base URLs
-        for base_url in base_urls:
-            print(f"\n🔗 Getting sub-URLs from: {base_url}")
-            sub_urls = self.get_sub_urls(base_url)
-            print(f"   Found {len(sub_urls)} sub-URLs")
+
+        # Get sub-URLs from all base URLs, fetched concurrently
+        sub_url_sets = await asyncio.gather(
+            *(self.get_sub_urls(client, base_url) for base_url in base_urls)
+        )
+        for base_url, sub_urls in zip(base_urls, sub_url_sets):
+            log.debug("%s: found %d sub-URLs", base_url, len(sub_urls))
             urls_to_scrape.update(sub_urls)
-        
-        # Limit to max_pages
-        urls_to_scrape = list(urls_to_scrape)[:max_pages]
-        
+
+        # Limit to max_pages; visited_urls keys on canonical form so a
+        # page scraped under one spelling isn't reloaded under another
+        urls_to_scrape = [
+            url for url in urls_to_scrape
+            if _canonical_url(url) not in self.visited_urls
+        ][:max_pages]
+
         print(f"\n📄 Scraping {len(urls_to_scrape)} pages...")
-        
-        # Scrape each URL
-        for i, url in enumerate(urls_to_scrape, 1):
-            if url in self.visited_urls:
+
+        # Fetch all pages concurrently, bounded by the semaphore so one
+        # company can't open unbounded connections against one host
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+        async def scrape_one(url):
+            async with semaphore:
+                return await self.scrape_page(client, url)
+
+        results = await asyncio.gather(
+            *(scrape_one(url) for url in urls_to_scrape),
+            return_exceptions=True,
+        )
+
+        for url, page_data in zip(urls_to_scrape, results):
+            if isinstance(page_data, Exception):
+                log.warning("%s: %s", url, page_data)
                 continue
-            
-            print(f"\n   [{i}/{len(urls_to_scrape)}] {url[:60]}...")
-            
-            page_data = self.scrape_page(url)
-            if page_data and len(page_data['content']) > 100:
+            if page_data and page_data['content_len'] > 100:
                 all_pages.append(page_data)
-                self.visited_urls.add(url)
-                print(f"      ✅ {len(page_data['content']):,} chars")
+                self.visited_urls.add(_canonical_url(url))
+                log.debug("scraped %s (%d chars)", url, page_data['content_len'])
             else:
-                print(f"      ⚠️  Skipped (insufficient content)")
-            
-            time.sleep(1)  # Be respectful
-        
+                log.debug("%s skipped (insufficient content)", url)
+
         # Save results
         if all_pages:
             print(f"\n💾 Saving {len(all_pages)} pages...")
             self.save_to_text_file(company_name, all_pages)
             self.save_to_pdf(company_name, all_pages)
             
-            total_chars = sum(len(p['content']) for p in all_pages)
+            total_chars = sum(p['content_len'] for p in all_pages)
             print(f"\n✅ {company_name} complete:")
             print(f"   Pages: {len(all_pages)}")
             print(f"   Content: {total_chars:,} characters")
@@ -345,29 +665,48 @@ class CSVWebsiteScraper:
         
         return all_pages
     
-    def run(self, max_pages_per_company: int = 20):
+    async def run(self, max_pages_per_company: int = 20):
         """Run the scraper"""
         print("\n" + "="*70)
         print("🕷️  CSV WEBSITE SCRAPER")
         print("="*70)
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        
+
         # Read CSV
         company_urls = self.read_csv()
-        
+
         if not company_urls:
             print("❌ No companies found in CSV")
             return
-        
-        # Setup driver
-        print("\n🚀 Setting up browser...")
-        self.setup_driver()
-        
+
         try:
-            # Scrape each company
-            for company_name, base_urls in company_urls.items():
-                self.scrape_company(company_name, base_urls, max_pages_per_company)
-            
+            # One shared client for every fetch; the browser only starts
+            # if a page actually needs the JS fallback
+            async with httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=30.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=MAX_CONCURRENCY * COMPANY_CONCURRENCY),
+            ) as client:
+                # Companies are independent, so several run at once; the
+                # per-domain semaphores keep any single host polite
+                company_sem = asyncio.Semaphore(COMPANY_CONCURRENCY)
+
+                async def scrape_one_company(company_name, base_urls):
+                    async with company_sem:
+                        await self.scrape_company(
+                            client, company_name, base_urls, max_pages_per_company
+                        )
+
+                outcomes = await asyncio.gather(*(
+                    scrape_one_company(company_name, base_urls)
+                    for company_name, base_urls in company_urls.items()
+                ), return_exceptions=True)
+
+                for company_name, outcome in zip(company_urls, outcomes):
+                    if isinstance(outcome, Exception):
+                        print(f"❌ {company_name} failed: {outcome}")
+
             # Summary
             print("\n" + "="*70)
             print("📊 SCRAPING COMPLETE")
@@ -379,8 +718,9 @@ class CSVWebsiteScraper:
             print("="*70)
             
         finally:
-            if self.driver:
-                self.driver.quit()
+            # Release any fallback drivers the run spun up
+            while not self._driver_pool.empty():
+                self._driver_pool.get_nowait().quit()
 
 def main():
     """Main function"""
@@ -400,7 +740,7 @@ def main():
     
     # Run scraper
     scraper = CSVWebsiteScraper(CSV_FILE, OUTPUT_DIR)
-    scraper.run(max_pages_per_company=MAX_PAGES)
+    asyncio.run(scraper.run(max_pages_per_company=MAX_PAGES))
 
 if __name__ == "__main__":
     main()
@@ -4,28 +4,26 @@ Run this to create the database and tables
 """
 import asyncio
 import asyncpg
-from sqlalchemy import text
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import make_url
 from app.core.database import async_engine
 from app.core.config import settings
 
 async def create_database():
     """Create the database if it doesn't exist"""
     try:
-        # Extract database info from URL
-        db_url_parts = settings.DATABASE_URL.replace("postgresql://", "").split("/")
-        connection_part = db_url_parts[0]  # postgres:password@localhost:5432
-        db_name = db_url_parts[1]  # flakersstudiodb
-        
-        user_pass, host_port = connection_part.split("@")
-        user, password = user_pass.split(":")
-        host, port = host_port.split(":")
-        
+        # SQLAlchemy's URL parser instead of hand-splitting on :/@ - it
+        # handles passwords containing separators, IPv6 hosts and missing
+        # ports, and percent-decodes credentials
+        url = make_url(settings.DATABASE_URL)
+        db_name = url.database
+
         # Connect to postgres database to create our database
         conn = await asyncpg.connect(
-            user=user,
-            password=password,
-            host=host,
-            port=port,
+            user=url.username,
+            password=url.password,
+            host=url.host,
+            port=url.port,
             database="postgres"
         )
         
@@ -49,16 +47,31 @@ async def create_database():
 async def create_tables():
     """Create all tables"""
     try:
-        from app.models import assistant, content, chat
-        
+        from app.models import assistant, content, chat, project, ingestion_tracking
+
         async with async_engine.begin() as conn:
             # Import all models to ensure they're registered
             from app.core.database import Base
-            
-            # Create all tables
-            await conn.run_sync(Base.metadata.create_all)
-            print("✅ Created all database tables")
-            
+
+            def _create_missing(sync_conn):
+                # One catalog query for the existing table names, then
+                # create only the diff with checkfirst=False - create_all's
+                # default probes information_schema once per table
+                existing = set(inspect(sync_conn).get_table_names())
+                missing = [
+                    t for t in Base.metadata.sorted_tables
+                    if t.name not in existing
+                ]
+                if missing:
+                    Base.metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+                return missing
+
+            missing = await conn.run_sync(_create_missing)
+            if missing:
+                print(f"✅ Created tables: {', '.join(t.name for t in missing)}")
+            else:
+                print("✅ All database tables already exist")
+
     except Exception as e:
         print(f"❌ Table creation error: {e}")
 
@@ -3,30 +3,44 @@ Manually trigger ingestion for assistants with completed discovery jobs
 """
 import asyncio
 import sys
-from sqlalchemy import select
+from sqlalchemy import select, update
 from app.core.database import AsyncSessionLocal
 from app.models.assistant import Assistant, AssistantStatus
 from app.models.content import IngestionJob
 from app.services.ingestion import IngestionService
 
-async def trigger_ingestion_for_assistant(assistant_id: str):
-    """Trigger ingestion for a specific assistant"""
-    async with AsyncSessionLocal() as db:
+async def trigger_ingestion_for_assistant(assistant_id: str, db=None,
+                                          assistant=None, discovery_job=None):
+    """Trigger ingestion for a specific assistant
+
+    Callers that already hold a session and the fetched rows (like
+    trigger_all_pending) pass them in so nothing is re-queried; run
+    standalone, the function opens its own session and looks them up.
+    """
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            return await trigger_ingestion_for_assistant(
+                assistant_id, db=session,
+                assistant=assistant, discovery_job=discovery_job,
+            )
+
+    if assistant is None:
         # Get assistant
         assistant_result = await db.execute(
             select(Assistant).where(Assistant.id == assistant_id)
         )
         assistant = assistant_result.scalar_one_or_none()
-        
-        if not assistant:
-            print(f"❌ Assistant {assistant_id} not found")
-            return False
-        
-        print(f"\n{'='*80}")
-        print(f"Assistant: {assistant.name}")
-        print(f"ID: {assistant.id}")
-        print(f"Current Status: {assistant.status.value}")
-        
+
+    if not assistant:
+        print(f"❌ Assistant {assistant_id} not found")
+        return False
+
+    print(f"\n{'='*80}")
+    print(f"Assistant: {assistant.name}")
+    print(f"ID: {assistant.id}")
+    print(f"Current Status: {assistant.status.value}")
+
+    if discovery_job is None:
         # Get the most recent completed discovery job
         jobs_result = await db.execute(
             select(IngestionJob)
@@ -36,78 +50,101 @@ async def trigger_ingestion_for_assistant(assistant_id: str):
             .limit(1)
         )
         discovery_job = jobs_result.scalar_one_or_none()
-        
-        if not discovery_job:
-            print(f"❌ No completed discovery job found for this assistant")
-            return False
-        
-        print(f"\nDiscovery Job ID: {discovery_job.id}")
-        print(f"URLs Discovered: {discovery_job.total_urls_discovered}")
-        print(f"URLs Scraped: {discovery_job.urls_scraped}")
-        
-        # Update assistant status
-        assistant.status = AssistantStatus.INGESTING
-        assistant.status_message = "Ingesting content into vector database"
-        await db.commit()
-        
-        print(f"\n✅ Updated assistant status to INGESTING")
-        print(f"🚀 Starting ingestion process...")
-        
-        # Start ingestion
-        ingestion_service = IngestionService()
-        user_name = "default_user"  # You can customize this
-        
-        await ingestion_service.start_ingestion(
-            job_id=str(discovery_job.id),
-            assistant_id=assistant_id,
-            assistant_name=assistant.name,
-            user_name=user_name
-        )
-        
-        print(f"✅ Ingestion started successfully!")
-        print(f"\nThe ingestion process is running in the background.")
-        print(f"It will:")
-        print(f"  1. Process scraped content into chunks")
-        print(f"  2. Generate embeddings")
-        print(f"  3. Upload to Qdrant vector database")
-        print(f"  4. Update assistant status to READY")
-        print(f"\nCheck the backend logs for progress.")
-        
-        return True
+
+    if not discovery_job:
+        print(f"❌ No completed discovery job found for this assistant")
+        return False
+
+    print(f"\nDiscovery Job ID: {discovery_job.id}")
+    print(f"URLs Discovered: {discovery_job.total_urls_discovered}")
+    print(f"URLs Scraped: {discovery_job.urls_scraped}")
+
+    # Update assistant status
+    assistant.status = AssistantStatus.INGESTING
+    assistant.status_message = "Ingesting content into vector database"
+    await db.commit()
+
+    print(f"\n✅ Updated assistant status to INGESTING")
+    print(f"🚀 Starting ingestion process...")
+
+    # Start ingestion
+    ingestion_service = IngestionService()
+    user_name = "default_user"  # You can customize this
+
+    await ingestion_service.start_ingestion(
+        job_id=str(discovery_job.id),
+        assistant_id=assistant_id,
+        assistant_name=assistant.name,
+        user_name=user_name
+    )
+
+    print(f"✅ Ingestion started successfully!")
+    print(f"\nThe ingestion process is running in the background.")
+    print(f"It will:")
+    print(f"  1. Process scraped content into chunks")
+    print(f"  2. Generate embeddings")
+    print(f"  3. Upload to Qdrant vector database")
+    print(f"  4. Update assistant status to READY")
+    print(f"\nCheck the backend logs for progress.")
+
+    return True
 
 async def trigger_all_pending():
     """Trigger ingestion for all assistants with completed discovery but not ready"""
     async with AsyncSessionLocal() as db:
-        # Find assistants that are stuck in 'creating' status with completed jobs
-        assistants_result = await db.execute(
-            select(Assistant).where(
-                Assistant.status.in_([AssistantStatus.CREATING, AssistantStatus.INGESTING])
+        # Find stuck assistants and their latest completed discovery job in
+        # one DISTINCT ON join - the old shape issued one query per
+        # assistant on top of the initial list
+        result = await db.execute(
+            select(Assistant, IngestionJob)
+            .join(IngestionJob, IngestionJob.assistant_id == Assistant.id)
+            .where(
+                Assistant.status.in_([AssistantStatus.CREATING, AssistantStatus.INGESTING]),
+                IngestionJob.status == "completed",
             )
+            .distinct(Assistant.id)
+            .order_by(Assistant.id, IngestionJob.started_at.desc())
         )
-        assistants = assistants_result.scalars().all()
-        
-        print(f"Found {len(assistants)} assistants in CREATING/INGESTING status")
-        
-        triggered = 0
-        for assistant in assistants:
-            # Check if there's a completed discovery job
-            jobs_result = await db.execute(
-                select(IngestionJob)
-                .where(IngestionJob.assistant_id == str(assistant.id))
-                .where(IngestionJob.status == "completed")
-                .order_by(IngestionJob.started_at.desc())
-                .limit(1)
+        pairs = result.all()
+
+        print(f"Found {len(pairs)} assistants in CREATING/INGESTING status with completed jobs")
+
+        if not pairs:
+            return
+
+        # Flip every status in one UPDATE and one commit instead of a
+        # write + commit per assistant
+        await db.execute(
+            update(Assistant)
+            .where(Assistant.id.in_([assistant.id for assistant, _ in pairs]))
+            .values(
+                status=AssistantStatus.INGESTING,
+                status_message="Ingesting content into vector database",
             )
-            discovery_job = jobs_result.scalar_one_or_none()
-            
-            if discovery_job:
-                print(f"\n📋 Triggering ingestion for: {assistant.name}")
-                success = await trigger_ingestion_for_assistant(str(assistant.id))
-                if success:
-                    triggered += 1
-                    # Wait a bit between triggers to avoid overwhelming the system
-                    await asyncio.sleep(2)
-        
+        )
+        await db.commit()
+
+        # start_ingestion just schedules background work, so the kickoffs
+        # run concurrently - the old loop slept 2s between each
+        ingestion_service = IngestionService()
+        results = await asyncio.gather(*(
+            ingestion_service.start_ingestion(
+                job_id=str(discovery_job.id),
+                assistant_id=str(assistant.id),
+                assistant_name=assistant.name,
+                user_name="default_user",
+            )
+            for assistant, discovery_job in pairs
+        ), return_exceptions=True)
+
+        triggered = 0
+        for (assistant, _), outcome in zip(pairs, results):
+            if isinstance(outcome, Exception):
+                print(f"❌ Failed to trigger {assistant.name}: {outcome}")
+            else:
+                print(f"📋 Triggered ingestion for: {assistant.name}")
+                triggered += 1
+
         print(f"\n{'='*80}")
         print(f"✅ Triggered ingestion for {triggered} assistant(s)")
 